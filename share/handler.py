@@ -3,6 +3,7 @@
 import json
 import os
 import logging
+import time
 import boto3
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -14,6 +15,12 @@ KST = timezone(timedelta(hours=9))
 # 스케줄 설정 파일 경로
 SCHEDULE_FILE = Path(__file__).parent / "data" / "schedule.json"
 
+# 공유 이후 단계(영상 목록, 메시지 생성/발송, 결과 저장)를 위해 남겨둘 실행 시간 (초)
+SHARE_TIME_MARGIN = 120
+
+# 미처리 사유 표시 이름
+PENDING_REASONS = {"circuit_open": "Drive 장애", "deadline": "실행 시간 한도"}
+
 
 def load_schedule() -> dict:
     """스케줄 설정 파일 로드."""
@@ -37,13 +44,36 @@ def get_current_week() -> int | None:
     return current_week
 
 
+def get_shared_weeks() -> list[int]:
+    """KST 기준 지금까지 공유된 주차 목록."""
+    schedule_config = load_schedule()
+    today = datetime.now(KST).date()
+    return sorted(
+        int(week_str) for week_str, date_str in schedule_config["schedule"].items()
+        if today >= datetime.strptime(date_str, "%Y-%m-%d").date()
+    )
+
+
 def get_schedule_config() -> dict:
     """스케줄 설정 반환."""
     return load_schedule()
 
-from services.drive_service import share_week_folders
-from services.bedrock_service import generate_simple_message
-from services.slack_service import send_message, send_error_message, send_to_response_url
+from services.drive_service import load_users, share_week_folders
+from services.notify_service import NotificationDigest, is_digest_mode, send_digests
+from services.profiler import profile_invocation
+from services.roster_service import ensure_roster_snapshot, sync_roster_delta
+from services.run_store import build_run_record, format_run_status, get_run_store
+from services.manifest_service import attach_video_manifests
+from services.error_aggregator import render_error_blocks, render_error_text
+from services.bedrock_service import generate_message, generate_simple_message
+from services.slack_service import (
+    fan_out_messages,
+    get_slack_config,
+    load_channels,
+    send_error_message,
+    send_message,
+    send_to_response_url,
+)
 
 # 로깅 설정
 logger = logging.getLogger()
@@ -66,6 +96,114 @@ def parse_slack_command(body: str) -> dict:
     }
 
 
+def build_deliveries(week: int, shared_folders: list[dict], current_batch: int, message: dict) -> list[dict]:
+    """관리 채널(전체 메시지) + 기수별 채널(해당 기수 메시지) 발송 목록 생성."""
+    deliveries = [{
+        "channel": get_slack_config()["channel"],
+        "message": message,
+        "label": "admin"
+    }]
+
+    channels = load_channels()
+    for folder in shared_folders:
+        channel = channels.get(folder["batch"])
+        if channel:
+            deliveries.append({
+                "channel": channel,
+                "message": generate_simple_message(week, [folder], current_batch),
+                "label": folder["batch"]
+            })
+
+    return deliveries
+
+
+def record_run(
+    week: int,
+    status: str,
+    share_result: dict | None,
+    started: float,
+    event: dict,
+    message: str | None = None
+) -> None:
+    """실행 결과 저장 (저장 실패가 공유 결과에 영향을 주지 않도록 처리)."""
+    try:
+        record = build_run_record(
+            week,
+            status,
+            share_result,
+            time.monotonic() - started,
+            datetime.now(KST).isoformat(timespec="seconds"),
+            user_name=event.get("user_name"),
+            message=message
+        )
+        get_run_store().save(record)
+    except Exception as e:
+        logger.warning(f"실행 결과 저장 실패: {e}")
+
+
+def report_share_errors(week: int, share_result: dict) -> None:
+    """실패 내역을 (유형, 기수)별 요약 Block Kit 메시지 1건으로 관리 채널에 발송."""
+    if not share_result["error_count"]:
+        return
+    if share_result.get("error_artifact"):
+        logger.info(f"에러 상세 기록: {share_result['error_artifact']}")
+    if share_result["shared_folders"]:
+        title = f"{week}주차 공유 중 일부 실패"
+    else:
+        title = f"{week}주차 공유 실패"
+    try:
+        send_message(render_error_blocks(
+            title,
+            share_result["errors"],
+            share_result["error_count"]
+        ))
+    except Exception as e:
+        logger.warning(f"에러 요약 발송 실패: {e}")
+
+
+def deliver_digest(digest: NotificationDigest | None) -> dict | None:
+    """모은 다이제스트 발송 (발송 실패가 공유 결과에 영향을 주지 않도록 처리)."""
+    if not digest:
+        return None
+    try:
+        digest_result = send_digests(digest)
+    except Exception as e:
+        logger.warning(f"다이제스트 발송 실패: {e}")
+        return None
+    logger.info(f"Digest result: {json.dumps(digest_result, ensure_ascii=False)}")
+    return digest_result
+
+
+def get_share_deadline(context) -> float | None:
+    """Lambda 남은 실행 시간에서 SHARE_TIME_MARGIN을 뺀 공유 마감 시각 (time.monotonic 기준)."""
+    if context is None or not hasattr(context, "get_remaining_time_in_millis"):
+        return None
+    return time.monotonic() + context.get_remaining_time_in_millis() / 1000 - SHARE_TIME_MARGIN
+
+
+def describe_pending(pending: list[dict]) -> str:
+    """미처리 사유 문구 (예: "Drive 장애", "Drive 장애/실행 시간 한도")."""
+    reasons = sorted({p.get("reason", "circuit_open") for p in pending})
+    return "/".join(PENDING_REASONS.get(reason, reason) for reason in reasons)
+
+
+def invoke_processor(payload: dict) -> None:
+    """프로세서 Lambda 비동기 호출 (함수 이름이 없으면 동기 처리)."""
+    function_name = os.environ.get("PROCESSOR_FUNCTION_NAME")
+
+    if function_name:
+        lambda_client.invoke(
+            FunctionName=function_name,
+            InvocationType="Event",  # 비동기 호출
+            Payload=json.dumps(payload)
+        )
+
+        logger.info(f"Async invoked: {function_name}")
+    else:
+        # Function name 없으면 동기 처리 (테스트용)
+        process_share(payload)
+
+
 def handler(event: dict, context) -> dict:
     """메인 핸들러 - 즉시 응답 + 비동기 처리 호출."""
     logger.info(f"Event: {json.dumps(event)}")
@@ -79,39 +217,52 @@ def handler(event: dict, context) -> dict:
 
         # 주차 파싱
         text = command["text"].strip()
+        response_url = command["response_url"]
 
-        if not text or not text.isdigit():
+        # 최근 공유 결과 조회 (Drive 호출 없이 저장소에서 응답)
+        if text == "status" or text.startswith("status "):
+            arg = text[len("status"):].strip()
+            status_week = int(arg) if arg.isdigit() else None
+            record = get_run_store().latest(status_week)
             return {
                 "statusCode": 200,
                 "body": json.dumps({
                     "response_type": "ephemeral",
-                    "text": "사용법: /share {주차}\n예: /share 3"
+                    "text": format_run_status(record, status_week)
                 })
             }
 
-        week = int(text)
-        response_url = command["response_url"]
-
-        # 비동기로 프로세서 Lambda 호출
-        function_name = os.environ.get("PROCESSOR_FUNCTION_NAME")
-
-        if function_name:
-            payload = {
-                "week": week,
+        # 명단 변경분 동기화
+        if text == "sync":
+            invoke_processor({
+                "mode": "roster_sync",
                 "response_url": response_url,
                 "user_name": command["user_name"]
+            })
+            return {
+                "statusCode": 200,
+                "body": json.dumps({
+                    "response_type": "ephemeral",
+                    "text": "⏳ 수강생 명단 변경분 동기화 중...\n완료되면 알려드릴게요!"
+                })
             }
 
-            lambda_client.invoke(
-                FunctionName=function_name,
-                InvocationType="Event",  # 비동기 호출
-                Payload=json.dumps(payload)
-            )
+        if not text or not text.isdigit():
+            return {
+                "statusCode": 200,
+                "body": json.dumps({
+                    "response_type": "ephemeral",
+                    "text": "사용법: /share {주차}\n예: /share 3\n공유 결과 조회: /share status [주차]\n명단 변경분 동기화: /share sync"
+                })
+            }
 
-            logger.info(f"Async invoked: {function_name}")
-        else:
-            # Function name 없으면 동기 처리 (테스트용)
-            process_share({"week": week, "response_url": response_url})
+        week = int(text)
+
+        invoke_processor({
+            "week": week,
+            "response_url": response_url,
+            "user_name": command["user_name"]
+        })
 
         # 즉시 응답 (3초 내)
         schedule_config = get_schedule_config()
@@ -142,14 +293,22 @@ def handler(event: dict, context) -> dict:
         }
 
 
+@profile_invocation
 def process_handler(event: dict, context) -> dict:
     """프로세서 핸들러 - Slack 커맨드 또는 EventBridge 스케줄에서 호출."""
     logger.info(f"Process Event: {json.dumps(event)}")
+    started = time.monotonic()
+    week = None
+    share_result = None
+    recorded = False
 
     try:
         schedule_config = get_schedule_config()
         response_url = event.get("response_url")
 
+        if event.get("mode") == "roster_sync":
+            return process_roster_sync(event, schedule_config)
+
         # week이 있으면 슬래시 커맨드, 없으면 스케줄 트리거
         if "week" in event:
             week = event["week"]
@@ -164,43 +323,112 @@ def process_handler(event: dict, context) -> dict:
         is_last_week = (week == last_week)
 
         # 1. Google Drive 폴더 공유
-        share_result = share_week_folders(week, current_batch, is_last_week=is_last_week)
+        # 다이제스트 모드는 알림 없이 공유하므로 이후 단계 실패와 관계없이 바로 알림 발송
+        # (재실행 시 이미 권한이 있는 사용자는 건너뛰어 다시 알릴 수 없음)
+        digest = NotificationDigest() if is_digest_mode() else None
+        try:
+            share_result = share_week_folders(
+                week,
+                current_batch,
+                is_last_week=is_last_week,
+                digest=digest,
+                deadline=get_share_deadline(context)
+            )
+        finally:
+            digest_result = deliver_digest(digest)
         logger.info(f"Share result: {json.dumps(share_result)}")
 
+        # 2. 실패 내역 요약을 관리 채널에 발송 (공유된 폴더가 없는 실행도 포함)
+        report_share_errors(week, share_result)
+
+        # 회로 차단으로 미처리된 작업 안내 (재실행 시 이미 공유된 사용자는 건너뜀)
+        pending = share_result.get("pending", [])
+        pending_msg = ""
+        if pending:
+            pending_count = sum(p["count"] for p in pending)
+            pending_msg = (
+                f"\n⚠️ {describe_pending(pending)}로 {len(pending)}개 기수 {pending_count}건 미처리 "
+                f"- `/share {week}` 재실행 시 이어서 처리합니다."
+            )
+
         if not share_result["shared_folders"]:
-            error_msg = f"❌ {week}주차 폴더를 찾을 수 없습니다."
+            if pending:
+                error_msg = f"❌ {week}주차 공유가 {describe_pending(pending)}로 중단되었습니다."
+            else:
+                error_msg = f"❌ {week}주차 폴더를 찾을 수 없습니다."
             if share_result["errors"]:
-                error_msg += f"\n오류: {share_result['errors']}"
+                error_msg += "\n" + render_error_text(share_result["errors"], share_result["error_count"])
+            error_msg += pending_msg
+
+            record_run(week, "error", share_result, started, event, message=error_msg)
+            recorded = True
 
             if response_url:
                 send_to_response_url(response_url, error_msg)
             return {"status": "error", "message": error_msg}
 
-        # 2. 메시지 생성 (템플릿 사용)
-        message = generate_simple_message(week, share_result["shared_folders"], current_batch)
+        # 3. 폴더별 영상 목록 추가 (캐시 우선, 시간 한도 초과 시 생략)
+        attach_video_manifests(share_result["shared_folders"])
+
+        # 4. 메시지 생성 (모델 생성 실패/지연 시 템플릿 사용)
+        message = generate_message(week, share_result["shared_folders"], current_batch)
+
+        # 5. Slack 관리 채널 + 기수별 채널에 메시지 발송
+        deliveries = build_deliveries(week, share_result["shared_folders"], current_batch, message)
+        delivery_report = fan_out_messages(deliveries)
+        logger.info(f"Delivery report: {json.dumps(delivery_report, ensure_ascii=False)}")
+
+        admin_report = delivery_report[0]
+        if not admin_report["ok"]:
+            raise Exception(f"관리 채널 메시지 발송 실패: {admin_report.get('error')}")
+        failed_channels = [r["label"] for r in delivery_report[1:] if not r["ok"]]
 
-        # 3. Slack 관리 채널에 메시지 발송
-        send_message(message)
+        # 첫 실행이면 현재 명단을 동기화 기준으로 저장 (저장 실패가 공유 결과에 영향을 주지 않도록 처리)
+        try:
+            ensure_roster_snapshot(load_users())
+        except Exception as e:
+            logger.warning(f"명단 스냅샷 저장 실패: {e}")
 
-        # 4. response_url로 완료 알림
+        # 6. response_url로 완료 알림
         shared_count = len(share_result["shared_folders"])
         success_msg = f"✅ {week}주차 영상 공유 완료! ({shared_count}개 기수)\n관리 채널에 메시지가 발송되었습니다."
+        if digest_result:
+            success_msg += f"\n📧 공유 알림 {digest_result['sent']}명 발송"
+            if digest_result["errors"]:
+                success_msg += f" (실패 {len(digest_result['errors'])}명)"
+        if failed_channels:
+            success_msg += f"\n⚠️ 기수 채널 발송 실패: {', '.join(failed_channels)}"
+        if share_result["error_count"]:
+            success_msg += f"\n⚠️ 오류 {share_result['error_count']}건 (관리 채널에 요약 발송)"
+        success_msg += pending_msg
+
+        record_run(week, "success", share_result, started, event)
+        recorded = True
 
         if response_url:
             send_to_response_url(response_url, success_msg)
 
-        return {"status": "success", "shared_count": shared_count}
+        return {
+            "status": "success",
+            "shared_count": shared_count,
+            "pending": len(pending),
+            "deliveries": delivery_report,
+            "digest": digest_result
+        }
 
     except Exception as e:
         logger.error(f"Process Error: {e}", exc_info=True)
 
+        if week is not None and not recorded:
+            record_run(week, "error", share_result, started, event, message=str(e))
+
         # 에러 알림
         try:
             send_error_message(str(e), {"event": str(event)[:500]})
             if event.get("response_url"):
                 send_to_response_url(
                     event["response_url"],
-                    f"❌ 처리 중 오류가 발생했습니다: {str(e)}"
+                    f"❌ 처리 중 오류가 발생했습니다: {str(e)[:500]}"
                 )
         except Exception:
             pass
@@ -208,6 +436,39 @@ def process_handler(event: dict, context) -> dict:
         return {"status": "error", "message": str(e)}
 
 
+def process_roster_sync(event: dict, schedule_config: dict) -> dict:
+    """명단 변경분 동기화 - 추가된 사용자에게 지난 주차 공유, 삭제된 사용자 권한 회수."""
+    response_url = event.get("response_url")
+    weeks = get_shared_weeks()
+    current_batch = schedule_config.get("current_batch", 8)
+    last_week = schedule_config.get("last_week", 9)
+
+    digest = NotificationDigest() if is_digest_mode() else None
+    try:
+        sync_result = sync_roster_delta(weeks, current_batch, last_week, digest=digest)
+    finally:
+        deliver_digest(digest)
+    logger.info(f"Roster sync result: {json.dumps(sync_result, ensure_ascii=False)}")
+
+    if sync_result.get("initialized"):
+        msg = "📋 동기화 기준 명단을 저장했습니다. 이후 변경분부터 반영됩니다."
+    else:
+        msg = (
+            f"✅ 명단 동기화 완료 (공유된 주차: {', '.join(map(str, weeks)) or '없음'})\n"
+            f"• 추가 {len(sync_result['added'])}명: 권한 {sync_result['granted']}건 부여\n"
+            f"• 삭제 {len(sync_result['removed'])}명: 권한 {sync_result['revoked']}건 회수"
+        )
+        if sync_result["remaining"]:
+            msg += f"\n⚠️ 미처리 {len(sync_result['remaining'])}명 - 다시 실행하면 이어서 처리합니다."
+        if sync_result["error_count"]:
+            msg += "\n❌ " + render_error_text(sync_result["errors"], sync_result["error_count"])
+
+    if response_url:
+        send_to_response_url(response_url, msg)
+
+    return {"status": "success", "mode": "roster_sync", **sync_result}
+
+
 def process_share(event: dict) -> dict:
     """동기 처리 (테스트용)."""
     return process_handler(event, None)
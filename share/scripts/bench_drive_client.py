@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""경량 Drive 클라이언트 vs discovery 기반 googleapiclient 비교 벤치마크.
+
+각 클라이언트를 새 인터프리터에서 import/생성해 import 시간, 생성 시간, 최대 RSS를 측정합니다.
+--folder-id를 주면 실제 Drive에 files.list / permissions.list 호출 지연도 측정합니다
+(GOOGLE_CREDENTIALS 또는 서비스 계정 파일 필요).
+
+googleapiclient는 Lambda 패키지에 포함하지 않으므로 벤치마크 전용 의존성을 따로 설치합니다:
+    pip install -r scripts/requirements-bench.txt
+
+사용법:
+    python scripts/bench_drive_client.py --runs 5
+    python scripts/bench_drive_client.py --runs 3 --folder-id <폴더ID> --calls 20
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SHARE_DIR = Path(__file__).resolve().parent.parent
+
+CLIENTS = ("slim", "discovery")
+
+
+def max_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB, Linux 기준 KB 단위)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure_once(kind: str, folder_id: str | None, calls: int) -> dict:
+    """새 프로세스에서 클라이언트 1회 측정 (자식 프로세스용)."""
+    sys.path.insert(0, str(SHARE_DIR))
+    baseline_rss = max_rss_mb()
+
+    # 클라이언트 자체 import만 측정 (credentials 로딩 모듈은 측정 후 import)
+    start = time.perf_counter()
+    if kind == "slim":
+        from services.drive_client import DriveClient
+    else:
+        from google.oauth2 import service_account
+        from googleapiclient.discovery import build
+    import_s = time.perf_counter() - start
+
+    from services.drive_service import SCOPES, load_credentials_info
+
+    result = {"kind": kind, "import_s": import_s}
+
+    try:
+        info = load_credentials_info()
+    except OSError:
+        info = None
+
+    if info:
+        start = time.perf_counter()
+        if kind == "slim":
+            client = DriveClient(info, SCOPES)
+        else:
+            credentials = service_account.Credentials.from_service_account_info(info, scopes=SCOPES)
+            client = build("drive", "v3", credentials=credentials, cache_discovery=False)
+        result["build_s"] = time.perf_counter() - start
+
+        if folder_id:
+            result["list_files_s"] = []
+            result["list_permissions_s"] = []
+            query = f"'{folder_id}' in parents"
+            for _ in range(calls):
+                start = time.perf_counter()
+                if kind == "slim":
+                    client.list_files(query)
+                else:
+                    client.files().list(
+                        q=query, fields="files(id, name)",
+                        supportsAllDrives=True, includeItemsFromAllDrives=True
+                    ).execute()
+                result["list_files_s"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                if kind == "slim":
+                    client.list_permissions(folder_id)
+                else:
+                    client.permissions().list(
+                        fileId=folder_id, supportsAllDrives=True,
+                        fields="nextPageToken, permissions(id, emailAddress, role)"
+                    ).execute()
+                result["list_permissions_s"].append(time.perf_counter() - start)
+
+    result["rss_mb"] = max_rss_mb()
+    result["rss_delta_mb"] = result["rss_mb"] - baseline_rss
+    return result
+
+
+def run_child(kind: str, folder_id: str | None, calls: int) -> dict:
+    """자식 프로세스로 1회 측정."""
+    args = [sys.executable, __file__, "--child", kind, "--calls", str(calls)]
+    if folder_id:
+        args += ["--folder-id", folder_id]
+    proc = subprocess.run(args, cwd=SHARE_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {"kind": kind, "error": proc.stderr.strip().splitlines()[-1] if proc.stderr else "failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def ms(values: list[float]) -> dict:
+    """지연 시간 요약 (ms)."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 1)
+    }
+
+
+def summarize(runs: list[dict]) -> dict:
+    """클라이언트별 측정 결과 요약."""
+    ok = [r for r in runs if "error" not in r]
+    if not ok:
+        return {"error": runs[0].get("error") if runs else "no runs"}
+
+    summary = {
+        "runs": len(ok),
+        "import": ms([r["import_s"] for r in ok]),
+        "rss_mb": round(statistics.median(r["rss_mb"] for r in ok), 1),
+        "rss_delta_mb": round(statistics.median(r["rss_delta_mb"] for r in ok), 1)
+    }
+    if all("build_s" in r for r in ok):
+        summary["build"] = ms([r["build_s"] for r in ok])
+    if all("list_files_s" in r for r in ok):
+        summary["list_files"] = ms([v for r in ok for v in r["list_files_s"]])
+        summary["list_permissions"] = ms([v for r in ok for v in r["list_permissions_s"]])
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Drive 클라이언트 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="클라이언트별 측정 횟수 (새 프로세스)")
+    parser.add_argument("--folder-id", help="실제 API 호출 측정용 폴더 ID")
+    parser.add_argument("--calls", type=int, default=10, help="실행당 API 호출 횟수")
+    parser.add_argument("--child", choices=CLIENTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_once(args.child, args.folder_id, args.calls)))
+        return 0
+
+    report = {
+        kind: summarize([run_child(kind, args.folder_id, args.calls) for _ in range(args.runs)])
+        for kind in CLIENTS
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""슬래시 커맨드 응답(ack) 지연 부하 테스트.
+
+/share 이벤트를 동시에 handler.handler로 재생하고 p50/p99/max 응답 시간을
+cold(새 프로세스 첫 호출, 모듈 import 포함)와 warm(재사용 컨테이너)으로 나눠 보고합니다.
+Lambda 클라이언트는 지연 시간을 설정할 수 있는 스텁으로 대체합니다.
+
+사용법:
+    python scripts/loadtest_ack.py --requests 200 --concurrency 20 --invoke-latency 0.15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlencode
+
+SHARE_DIR = Path(__file__).resolve().parent.parent
+
+# Slack 슬래시 커맨드 응답 제한 (초)
+SLACK_ACK_DEADLINE = 3.0
+
+
+class StubLambdaClient:
+    """invoke 호출에 지연만 주는 Lambda 클라이언트 스텁."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    def invoke(self, **kwargs) -> dict:
+        time.sleep(self.latency)
+        self.calls += 1
+        return {"StatusCode": 202}
+
+
+def make_event(week: int, i: int) -> dict:
+    """API Gateway 형식의 /share 이벤트 생성."""
+    body = urlencode({
+        "command": "/share",
+        "text": str(week),
+        "user_id": f"U{i:08d}",
+        "user_name": f"loadtest{i}",
+        "channel_id": "CLOADTEST",
+        "response_url": "https://hooks.slack.com/services/T000/B000/loadtest"
+    })
+    return {"httpMethod": "POST", "path": "/share", "body": body}
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """최근접 순위 백분위수."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: list[float]) -> dict:
+    """지연 시간 통계 (ms)."""
+    if not latencies:
+        return {"count": 0}
+    return {
+        "count": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(max(latencies) * 1000, 1),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 1)
+    }
+
+
+def prepare_env() -> None:
+    """비동기 호출 경로를 타도록 환경변수 설정."""
+    os.environ.setdefault("PROCESSOR_FUNCTION_NAME", "loadtest-shareProcessor")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "ap-northeast-2")
+    if str(SHARE_DIR) not in sys.path:
+        sys.path.insert(0, str(SHARE_DIR))
+
+
+def run_cold_once(week: int, invoke_latency: float) -> dict:
+    """새 프로세스에서 handler import + 첫 호출 시간 측정 (자식 프로세스용)."""
+    prepare_env()
+    start = time.perf_counter()
+    import handler
+    import_time = time.perf_counter() - start
+
+    handler.lambda_client = StubLambdaClient(invoke_latency)
+    call_start = time.perf_counter()
+    response = handler.handler(make_event(week, 0), None)
+    call_time = time.perf_counter() - call_start
+
+    return {
+        "import_s": import_time,
+        "call_s": call_time,
+        "total_s": import_time + call_time,
+        "status": response.get("statusCode")
+    }
+
+
+def run_cold(runs: int, week: int, invoke_latency: float) -> list[dict]:
+    """cold start를 runs번 측정 (매번 새 인터프리터)."""
+    results = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [
+                sys.executable, __file__, "--cold-child",
+                "--week", str(week),
+                "--invoke-latency", str(invoke_latency)
+            ],
+            cwd=SHARE_DIR,
+            capture_output=True,
+            text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"cold 측정 실패:\n{proc.stderr}")
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def run_warm(requests: int, concurrency: int, week: int, invoke_latency: float) -> tuple[list[float], int]:
+    """현재 프로세스에서 동시 호출로 warm 지연 측정."""
+    prepare_env()
+    import handler
+
+    handler.lambda_client = StubLambdaClient(invoke_latency)
+
+    def call(i: int) -> tuple[float, bool]:
+        start = time.perf_counter()
+        response = handler.handler(make_event(week, i), None)
+        elapsed = time.perf_counter() - start
+        ok = response.get("statusCode") == 200 and "❌" not in response.get("body", "")
+        return elapsed, ok
+
+    # 첫 호출은 워밍업 (측정 제외)
+    call(0)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(call, range(1, requests + 1)))
+
+    latencies = [elapsed for elapsed, _ in results]
+    failures = sum(1 for _, ok in results if not ok)
+    return latencies, failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="/share ack 지연 부하 테스트")
+    parser.add_argument("--requests", type=int, default=200, help="warm 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--invoke-latency", type=float, default=0.1, help="lambda invoke 스텁 지연 (초)")
+    parser.add_argument("--cold-runs", type=int, default=5, help="cold start 측정 횟수")
+    parser.add_argument("--week", type=int, default=3, help="요청 주차")
+    parser.add_argument("--budget", type=float, default=SLACK_ACK_DEADLINE, help="허용 응답 시간 (초)")
+    parser.add_argument("--cold-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_child:
+        print(json.dumps(run_cold_once(args.week, args.invoke_latency)))
+        return 0
+
+    cold = run_cold(args.cold_runs, args.week, args.invoke_latency) if args.cold_runs else []
+    warm, failures = run_warm(args.requests, args.concurrency, args.week, args.invoke_latency)
+
+    report = {
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "invoke_latency_s": args.invoke_latency,
+            "budget_s": args.budget
+        },
+        "cold": summarize([r["total_s"] for r in cold]),
+        "cold_import": summarize([r["import_s"] for r in cold]),
+        "warm": summarize(warm),
+        "failures": failures
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    worst = max([r["total_s"] for r in cold] + warm)
+    if worst >= args.budget or failures:
+        print(f"❌ 응답 예산 초과 또는 실패 (max {worst * 1000:.1f}ms, 실패 {failures}건)", file=sys.stderr)
+        return 1
+
+    print(f"✅ 모든 응답이 {args.budget}초 이내 (max {worst * 1000:.1f}ms)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""서비스 계정 풀.
+
+여러 서비스 계정에 Drive 작업을 나눠 계정별 공유 할당량을 합쳐 사용합니다.
+계정마다 rate limit 상태를 따로 관리하고, 제한에 걸린 계정은 대기 시간 동안 배정하지 않습니다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Account:
+    """풀에 속한 서비스 계정 1개의 상태."""
+
+    def __init__(self, name: str, client):
+        self.name = name
+        self.client = client
+        self.in_flight = 0
+        self.throttled_until = 0.0
+        self.calls = 0
+        self.throttles = 0
+
+
+class AccountPool:
+    """진행 중 작업이 가장 적고 rate limit에 걸리지 않은 계정을 배정하는 풀."""
+
+    def __init__(self, accounts: list[Account], clock=time.monotonic, sleep=time.sleep):
+        if not accounts:
+            raise ValueError("서비스 계정이 없습니다.")
+        self.accounts = accounts
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self.accounts)
+
+    @property
+    def primary(self) -> Account:
+        """조회용 기본 계정."""
+        return self.accounts[0]
+
+    def _pick(self) -> tuple[Account | None, float]:
+        """사용 가능한 계정 또는 (None, 가장 빨리 풀리는 시각까지 대기 시간)."""
+        now = self._clock()
+        available = [a for a in self.accounts if a.throttled_until <= now]
+        if available:
+            return min(available, key=lambda a: (a.in_flight, a.calls)), 0.0
+        return None, min(a.throttled_until for a in self.accounts) - now
+
+    def acquire(self) -> Account:
+        """계정 배정 (모든 계정이 제한 중이면 가장 빨리 풀리는 계정까지 대기)."""
+        while True:
+            with self._lock:
+                account, wait = self._pick()
+                if account is not None:
+                    account.in_flight += 1
+                    account.calls += 1
+                    return account
+            self._sleep(max(wait, 0.0))
+
+    def release(self, account: Account) -> None:
+        with self._lock:
+            account.in_flight -= 1
+
+    @contextmanager
+    def account(self):
+        """with pool.account() as account: 형태로 배정/반납."""
+        account = self.acquire()
+        try:
+            yield account
+        finally:
+            self.release(account)
+
+    def mark_throttled(self, account: Account, seconds: float) -> None:
+        """계정을 seconds 동안 배정에서 제외."""
+        with self._lock:
+            account.throttles += 1
+            account.throttled_until = max(account.throttled_until, self._clock() + seconds)
+
+    def stats(self, since: list[dict] | None = None) -> list[dict]:
+        """계정별 호출/제한 횟수.
+
+        Args:
+            since: 이전에 조회한 stats() 결과 (주어지면 그 이후 증가분만 반환)
+
+        Returns:
+            계정별 호출/제한 횟수 리스트
+        """
+        baseline = {s["account"]: s for s in since or []}
+        with self._lock:
+            return [
+                {
+                    "account": a.name,
+                    "calls": a.calls - baseline.get(a.name, {}).get("calls", 0),
+                    "throttles": a.throttles - baseline.get(a.name, {}).get("throttles", 0)
+                }
+                for a in self.accounts
+            ]
@@ -1,5 +1,43 @@
 """메시지 생성 서비스."""
 
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from services.run_store import get_run_store
+
+logger = logging.getLogger()
+
+# 생성 결과 캐시 상태 이름 접두어 (실행 결과 저장소에 보관해 콜드 스타트 후에도 유지)
+INTRO_STATE_PREFIX = "message_intro:"
+
+# 모델 응답 대기 한도 (초) - 초과 시 템플릿으로 즉시 대체
+DEFAULT_GENERATION_TIMEOUT = 2.0
+
+# Bedrock 기본 모델
+DEFAULT_BEDROCK_MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
+
+# 폴더별로 메시지에 보여줄 최대 영상 제목 수
+MAX_LISTED_VIDEOS = 5
+
+
+def format_folder_line(folder: dict) -> str:
+    """폴더 안내 문구 (영상 매니페스트가 있으면 영상 수와 제목 포함)."""
+    line = f"📁 {folder['batch']} {folder['week']}주차 영상 폴더"
+    if "video_count" in folder:
+        line += f" ({folder['video_count']}개)"
+    line += f" → <{folder['link']}|링크>"
+
+    titles = folder.get("video_titles") or []
+    for title in titles[:MAX_LISTED_VIDEOS]:
+        line += f"\n    • {title}"
+    if len(titles) > MAX_LISTED_VIDEOS:
+        line += f"\n    • 외 {len(titles) - MAX_LISTED_VIDEOS}개"
+    return line
+
 
 def generate_simple_message(week: int, shared_folders: list[dict], current_batch: int = 8) -> dict:
     """공유 메시지 생성 (Block Kit 형식).
@@ -25,10 +63,7 @@ def generate_simple_message(week: int, shared_folders: list[dict], current_batch
     if prev_folders:
         intro = f"과제 이해도를 높이는 데 도움이 될 만한 역대 기수들의 {prev_week}주차 관련 영상들을 참고해 보세요."
 
-        prev_folder_lines = "\n".join([
-            f"📁 {f['batch']} {f['week']}주차 영상 폴더 → <{f['link']}|링크>"
-            for f in prev_folders
-        ])
+        prev_folder_lines = "\n".join([format_folder_line(f) for f in prev_folders])
 
         blocks.extend([
             {
@@ -61,7 +96,7 @@ def generate_simple_message(week: int, shared_folders: list[dict], current_batch
     # 현재 기수 섹션
     if curr_folders:
         curr_folder = curr_folders[0]
-        curr_folder_line = f"📁 {curr_folder['batch']} {curr_folder['week']}주차 영상 폴더 → <{curr_folder['link']}|링크>"
+        curr_folder_line = format_folder_line(curr_folder)
 
         # 이전 기수 있으면 구분선 추가
         if prev_folders:
@@ -100,3 +135,156 @@ def generate_simple_message(week: int, shared_folders: list[dict], current_batch
         "blocks": blocks,
         "text": f"🎥 {prev_week}주차 영상 자료 및 {current_batch}기 이번주차 영상"
     }
+
+
+def build_intro_prompt(week: int, shared_folders: list[dict], current_batch: int) -> str:
+    """주간 소개 문구 생성용 프롬프트."""
+    folder_lines = "\n".join([f"- {f['batch']} {f['week']}주차" for f in shared_folders])
+    return (
+        "클라우드 시큐리티 강의 수강생에게 이번 주 공유되는 강의 영상을 소개하는 "
+        "Slack 안내 문구를 한국어 2~3문장으로 작성해 주세요. 링크나 목록은 넣지 마세요.\n"
+        f"현재 기수: {current_batch}기, 주차: {week}주차\n"
+        f"공유 폴더:\n{folder_lines}"
+    )
+
+
+def bedrock_generator(prompt: str) -> str:
+    """Bedrock 모델로 문구 생성."""
+    import boto3
+    from botocore.config import Config
+
+    timeout = float(os.environ.get("MESSAGE_GENERATION_TIMEOUT", DEFAULT_GENERATION_TIMEOUT))
+    client = boto3.client(
+        "bedrock-runtime",
+        config=Config(read_timeout=timeout, connect_timeout=timeout, retries={"max_attempts": 0})
+    )
+    response = client.invoke_model(
+        modelId=os.environ.get("BEDROCK_MODEL_ID", DEFAULT_BEDROCK_MODEL_ID),
+        body=json.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 300,
+            "messages": [{"role": "user", "content": prompt}]
+        })
+    )
+    result = json.loads(response["body"].read())
+    return result["content"][0]["text"].strip()
+
+
+def make_stub_generator(text: str = "이번 주 영상으로 복습해 보세요.", delay: float = 0.0):
+    """로컬 테스트용 생성기 (지연 시간 설정 가능)."""
+    def generator(prompt: str) -> str:
+        if delay:
+            time.sleep(delay)
+        return text
+
+    return generator
+
+
+def get_generator():
+    """MESSAGE_GENERATOR 환경변수에 따른 생성기. 설정이 없으면 None (템플릿만 사용)."""
+    name = os.environ.get("MESSAGE_GENERATOR", "").lower()
+    if name == "bedrock":
+        return bedrock_generator
+    if name == "stub":
+        return make_stub_generator()
+    return None
+
+
+def get_cache_key(course: str, shared_folders: list[dict], week: int) -> str:
+    """(강의, 기수 조합, 주차) 기준 캐시 키."""
+    cohorts = ",".join(sorted(f"{f['batch']}:{f['week']}" for f in shared_folders))
+    raw = f"{course}|{cohorts}|{week}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def load_cached_intro(key: str) -> str | None:
+    """캐시된 소개 문구 조회 (조회 실패 시 None)."""
+    try:
+        state = get_run_store().load_state(INTRO_STATE_PREFIX + key)
+    except Exception as e:
+        logger.warning(f"소개 문구 캐시 조회 실패: {e}")
+        return None
+    return state.get("intro") if state else None
+
+
+def save_cached_intro(key: str, intro: str) -> None:
+    """소개 문구 캐시 저장 (실패해도 무시)."""
+    try:
+        get_run_store().save_state(INTRO_STATE_PREFIX + key, {"intro": intro})
+    except Exception as e:
+        logger.warning(f"소개 문구 캐시 저장 실패: {e}")
+
+
+def generate_intro(prompt: str, key: str, generator, timeout: float) -> str | None:
+    """시간 제한 내에서 소개 문구 생성. 시간 초과/실패 시 None.
+
+    시간 초과된 생성이 나중에 끝나면 결과를 캐시에 저장해 다음 실행에서 사용합니다.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(generator, prompt)
+
+    def cache_result(done):
+        if not done.cancelled() and done.exception() is None and done.result():
+            save_cached_intro(key, done.result())
+
+    future.add_done_callback(cache_result)
+    executor.shutdown(wait=False)
+
+    try:
+        return future.result(timeout=timeout) or None
+    except FutureTimeoutError:
+        logger.warning(f"메시지 생성 시간 초과 ({timeout}초) - 템플릿 사용")
+    except Exception as e:
+        logger.warning(f"메시지 생성 실패 - 템플릿 사용: {e}")
+    return None
+
+
+def generate_message(
+    week: int,
+    shared_folders: list[dict],
+    current_batch: int = 8,
+    course: str | None = None,
+    generator=None,
+    timeout: float | None = None
+) -> dict:
+    """공유 메시지 생성 (모델 생성 소개 문구 + Block Kit 템플릿).
+
+    생성기가 없거나 시간 내 응답이 없으면 generate_simple_message 결과를 그대로 반환합니다.
+
+    Args:
+        week: 현재 기수 기준 주차
+        shared_folders: 공유된 폴더 정보 리스트
+        current_batch: 현재 운영 기수
+        course: 강의 이름 (캐시 키, 기본값 COURSE_NAME 환경변수)
+        generator: 프롬프트를 받아 문구를 반환하는 함수 (기본값 MESSAGE_GENERATOR 환경변수)
+        timeout: 모델 응답 대기 한도 (초)
+
+    Returns:
+        Slack Block Kit 형식의 메시지
+    """
+    message = generate_simple_message(week, shared_folders, current_batch)
+
+    generator = generator or get_generator()
+    if generator is None or not shared_folders:
+        return message
+
+    course = course or os.environ.get("COURSE_NAME", "cloud-security")
+    if timeout is None:
+        timeout = float(os.environ.get("MESSAGE_GENERATION_TIMEOUT", DEFAULT_GENERATION_TIMEOUT))
+
+    key = get_cache_key(course, shared_folders, week)
+    intro = load_cached_intro(key)
+    if intro is None:
+        prompt = build_intro_prompt(week, shared_folders, current_batch)
+        intro = generate_intro(prompt, key, generator, timeout)
+
+    if intro:
+        message["blocks"].insert(0, {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": intro
+            }
+        })
+
+    return message
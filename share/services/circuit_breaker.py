@@ -0,0 +1,170 @@
+"""외부 의존성(Drive 읽기/쓰기, Slack) 서킷 브레이커."""
+
+import threading
+import time
+from collections import deque
+
+# 의존성 이름
+DRIVE_READ = "drive_read"
+DRIVE_WRITE = "drive_write"
+SLACK = "slack"
+
+# 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출을 즉시 거부할 때 발생."""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{name} 회로 차단 중 ({retry_after:.0f}초 후 재시도)")
+
+
+class CircuitBreaker:
+    """최근 호출의 에러율 기반 서킷 브레이커.
+
+    - CLOSED: 정상 호출, 최근 window_size개 결과 중 에러율이 임계값 이상이면 OPEN
+    - OPEN: recovery_timeout 동안 모든 호출 즉시 거부
+    - HALF_OPEN: 탐색 호출 1건만 허용, 성공하면 CLOSED / 실패하면 다시 OPEN
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        min_calls: int = 5,
+        window_size: int = 20,
+        recovery_timeout: float = 30.0,
+        clock=time.monotonic
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._results = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (OPEN 유지 시간이 지나면 HALF_OPEN으로 전환)."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def retry_after(self) -> float:
+        """OPEN 상태가 풀리기까지 남은 시간(초)."""
+        with self._lock:
+            if self._current_state() != OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (self._clock() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부. HALF_OPEN에서는 탐색 호출 1건만 허용."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """호출 성공 기록."""
+        with self._lock:
+            if self._current_state() == HALF_OPEN:
+                self._state = CLOSED
+                self._results.clear()
+                self._probe_in_flight = False
+                return
+            self._results.append(True)
+
+    def record_failure(self) -> None:
+        """호출 실패 기록."""
+        with self._lock:
+            if self._current_state() == HALF_OPEN:
+                self._trip()
+                return
+            self._results.append(False)
+            failures = self._results.count(False)
+            if (
+                len(self._results) >= self.min_calls
+                and failures / len(self._results) >= self.failure_rate_threshold
+            ):
+                self._trip()
+
+    def record_ignored(self) -> None:
+        """결과를 기록하지 않음 (HALF_OPEN 탐색 호출이면 다음 탐색 허용)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+        self._results.clear()
+
+    def reset(self) -> None:
+        """CLOSED 상태로 초기화."""
+        with self._lock:
+            self._state = CLOSED
+            self._results.clear()
+            self._probe_in_flight = False
+
+    def call(self, func, *args, is_failure=None, is_ignored=None, **kwargs):
+        """회로 상태를 확인하고 func 호출.
+
+        Args:
+            func: 호출할 함수
+            is_failure: 예외를 의존성 장애로 볼지 판단하는 함수 (기본: 모든 예외)
+            is_ignored: 성공/실패 어느 쪽으로도 기록하지 않을 예외 판단 함수
+                (호출자가 재시도로 처리하고 최종 결과만 따로 기록하는 경우)
+
+        Returns:
+            func 반환값
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있는 경우
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(self.name, self.retry_after())
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_ignored is not None and is_ignored(e):
+                self.record_ignored()
+            elif is_failure is None or is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+
+        self.record_success()
+        return result
+
+
+# Lambda 컨테이너 재사용 시에도 상태 유지
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """의존성별 서킷 브레이커 조회 (없으면 생성)."""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
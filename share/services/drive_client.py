@@ -0,0 +1,243 @@
+"""경량 Google Drive REST 클라이언트.
+
+discovery 문서를 불러오는 googleapiclient 대신 프로세서가 사용하는 API만 직접 호출합니다.
+- files.list
+- permissions.create (배치 포함)
+- permissions.list / permissions.delete
+"""
+
+import json
+import threading
+import time
+import uuid
+
+import requests
+from google.auth import crypt, jwt
+from requests.adapters import HTTPAdapter
+
+TOKEN_URL = "https://oauth2.googleapis.com/token"
+DRIVE_API_URL = "https://www.googleapis.com/drive/v3"
+BATCH_URL = "https://www.googleapis.com/batch/drive/v3"
+
+# 토큰 만료 전 갱신 여유 (초)
+TOKEN_REFRESH_MARGIN = 60
+
+# 토큰 유효 시간 (초, 최대 1시간)
+TOKEN_LIFETIME = 3600
+
+# 요청 타임아웃 (초)
+REQUEST_TIMEOUT = 30
+
+# 배치 요청당 최대 호출 수 (Drive 제한)
+MAX_BATCH_SIZE = 100
+
+# 커넥션 풀 크기
+POOL_SIZE = 10
+
+
+class DriveApiError(Exception):
+    """Drive API 에러 응답.
+
+    메시지에 reason(rateLimitExceeded 등)을 포함해 기존 문자열 기반 처리와 호환됩니다.
+    """
+
+    def __init__(self, status: int, reason: str, message: str):
+        self.status = status
+        self.reason = reason
+        super().__init__(f"<HttpError {status}: {reason}: {message}>")
+
+
+def parse_error(status: int, payload: dict | None, text: str = "") -> DriveApiError:
+    """Drive 에러 응답 본문을 DriveApiError로 변환."""
+    error = (payload or {}).get("error", {})
+    if not isinstance(error, dict):
+        return DriveApiError(status, str(error), text)
+    errors = error.get("errors") or [{}]
+    reason = errors[0].get("reason", "") or error.get("status", "")
+    return DriveApiError(status, reason, error.get("message", text))
+
+
+def create_session() -> requests.Session:
+    """커넥션 재사용을 위한 풀 세션."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    return session
+
+
+class DriveClient:
+    """서비스 계정 JWT 인증 + 커넥션 풀 세션 기반 Drive 클라이언트."""
+
+    def __init__(self, credentials_info: dict, scopes: list[str], session: requests.Session | None = None):
+        self._email = credentials_info["client_email"]
+        self._signer = crypt.RSASigner.from_service_account_info(credentials_info)
+        self._scopes = " ".join(scopes)
+        self._session = session or create_session()
+        self._token = None
+        self._token_expiry = 0.0
+        self._token_lock = threading.Lock()
+
+    def _fetch_token(self) -> tuple[str, float]:
+        """서명된 JWT로 액세스 토큰 발급."""
+        now = int(time.time())
+        assertion = jwt.encode(self._signer, {
+            "iss": self._email,
+            "scope": self._scopes,
+            "aud": TOKEN_URL,
+            "iat": now,
+            "exp": now + TOKEN_LIFETIME
+        })
+        response = self._session.post(
+            TOKEN_URL,
+            data={
+                "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+                "assertion": assertion.decode() if isinstance(assertion, bytes) else assertion
+            },
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code != 200:
+            raise DriveApiError(response.status_code, "tokenError", response.text)
+        result = response.json()
+        return result["access_token"], time.time() + result.get("expires_in", TOKEN_LIFETIME)
+
+    def access_token(self) -> str:
+        """캐시된 액세스 토큰 (만료 임박 시 갱신)."""
+        with self._token_lock:
+            if not self._token or time.time() >= self._token_expiry - TOKEN_REFRESH_MARGIN:
+                self._token, self._token_expiry = self._fetch_token()
+            return self._token
+
+    def _request(self, method: str, path: str, params: dict | None = None, body: dict | None = None) -> dict:
+        response = self._session.request(
+            method,
+            f"{DRIVE_API_URL}{path}",
+            params=params,
+            json=body,
+            headers={"Authorization": f"Bearer {self.access_token()}"},
+            timeout=REQUEST_TIMEOUT
+        )
+        try:
+            payload = response.json() if response.content else {}
+        except ValueError:
+            payload = None
+        if response.status_code >= 400:
+            raise parse_error(response.status_code, payload, response.text)
+        return payload or {}
+
+    def list_files(self, q: str, fields: str = "files(id, name)", page_token: str | None = None, page_size: int | None = None) -> dict:
+        """files.list (공유 드라이브 포함)."""
+        params = {
+            "q": q,
+            "fields": fields,
+            "supportsAllDrives": "true",
+            "includeItemsFromAllDrives": "true"
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        if page_size:
+            params["pageSize"] = page_size
+        return self._request("GET", "/files", params=params)
+
+    def create_permission(self, file_id: str, body: dict, send_notification: bool = False) -> dict:
+        """permissions.create."""
+        params = {
+            "sendNotificationEmail": "true" if send_notification else "false",
+            "supportsAllDrives": "true"
+        }
+        return self._request("POST", f"/files/{file_id}/permissions", params=params, body=body)
+
+    def delete_permission(self, file_id: str, permission_id: str) -> dict:
+        """permissions.delete."""
+        return self._request(
+            "DELETE",
+            f"/files/{file_id}/permissions/{permission_id}",
+            params={"supportsAllDrives": "true"}
+        )
+
+    def list_permissions(self, file_id: str, fields: str = "nextPageToken, permissions(id, emailAddress, role)") -> list[dict]:
+        """permissions.list (모든 페이지)."""
+        permissions = []
+        page_token = None
+        while True:
+            params = {"fields": fields, "supportsAllDrives": "true", "pageSize": 100}
+            if page_token:
+                params["pageToken"] = page_token
+            result = self._request("GET", f"/files/{file_id}/permissions", params=params)
+            permissions.extend(result.get("permissions", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return permissions
+
+    def batch_create_permissions(self, file_id: str, bodies: list[dict], send_notification: bool = False) -> list[dict | DriveApiError]:
+        """permissions.create 배치 호출 (요청당 최대 100건).
+
+        Returns:
+            bodies 순서대로 생성된 권한 정보 또는 DriveApiError
+        """
+        results = []
+        for start in range(0, len(bodies), MAX_BATCH_SIZE):
+            results.extend(self._batch_chunk(file_id, bodies[start:start + MAX_BATCH_SIZE], send_notification))
+        return results
+
+    def _batch_chunk(self, file_id: str, bodies: list[dict], send_notification: bool) -> list[dict | DriveApiError]:
+        boundary = f"batch_{uuid.uuid4().hex}"
+        query = f"sendNotificationEmail={'true' if send_notification else 'false'}&supportsAllDrives=true"
+
+        parts = []
+        for i, body in enumerate(bodies):
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <item{i}>\r\n\r\n"
+                f"POST /drive/v3/files/{file_id}/permissions?{query}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{json.dumps(body)}\r\n"
+            )
+        payload = "".join(parts) + f"--{boundary}--"
+
+        response = self._session.post(
+            BATCH_URL,
+            data=payload.encode("utf-8"),
+            headers={
+                "Authorization": f"Bearer {self.access_token()}",
+                "Content-Type": f"multipart/mixed; boundary={boundary}"
+            },
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code >= 400:
+            raise parse_error(response.status_code, None, response.text)
+
+        return parse_batch_response(response, len(bodies))
+
+
+def parse_batch_response(response: requests.Response, count: int) -> list[dict | DriveApiError]:
+    """multipart/mixed 배치 응답을 Content-ID 순서대로 파싱."""
+    content_type = response.headers.get("Content-Type", "")
+    boundary = content_type.split("boundary=")[-1].strip('"')
+    results: list[dict | DriveApiError] = [
+        DriveApiError(0, "missingResponse", "배치 응답 누락") for _ in range(count)
+    ]
+
+    for part in response.text.split(f"--{boundary}"):
+        if "HTTP/1.1" not in part:
+            continue
+        # Content-ID: <response-item3>
+        index = None
+        for line in part.splitlines():
+            if line.lower().startswith("content-id:"):
+                index = int(line.split("item")[-1].strip(" >"))
+                break
+        if index is None or index >= count:
+            continue
+
+        http_part = part[part.index("HTTP/1.1"):]
+        status = int(http_part.split(" ", 2)[1])
+        body_text = http_part.split("\r\n\r\n", 1)[-1].strip() if "\r\n\r\n" in http_part else http_part.split("\n\n", 1)[-1].strip()
+        try:
+            payload = json.loads(body_text) if body_text else {}
+        except ValueError:
+            payload = None
+
+        results[index] = parse_error(status, payload, body_text) if status >= 400 else (payload or {})
+
+    return results
@@ -2,10 +2,15 @@
 
 import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+
+from services.circuit_breaker import DRIVE_READ, DRIVE_WRITE, CircuitOpenError, get_breaker
+from services.account_pool import Account, AccountPool
+from services.drive_client import DriveApiError, DriveClient
+from services.error_aggregator import ErrorAggregator
 
 # 파일 경로
 DATA_DIR = Path(__file__).parent.parent / "data"
@@ -15,31 +20,66 @@ USERS_FILE = DATA_DIR / "users.txt"
 # Service Account 인증
 SCOPES = ["https://www.googleapis.com/auth/drive"]
 
+_account_pool: AccountPool | None = None
+_account_pool_lock = threading.Lock()
+
 
-def get_drive_service():
-    """Service Account로 Drive 서비스 생성."""
+def load_credentials_pool() -> list[dict]:
+    """Service Account credentials 목록 로드.
+
+    - GOOGLE_CREDENTIALS: JSON 객체 1개 또는 JSON 배열 (로컬용, Lambda 환경변수는 전체 4KB 제한)
+    - GOOGLE_CREDENTIALS_DIR: 디렉터리의 *.json 파일 (파일명 순, 상대 경로는 패키지 기준)
+    - 둘 다 없으면 패키지/로컬 파일 1개
+    """
     # Lambda 환경변수에서 credentials 가져오기
     credentials_json = os.environ.get("GOOGLE_CREDENTIALS")
 
     if credentials_json:
         # Lambda: 환경변수에서 credentials
-        credentials_info = json.loads(credentials_json)
-        credentials = service_account.Credentials.from_service_account_info(
-            credentials_info,
-            scopes=SCOPES
-        )
-    else:
-        # 파일에서 credentials (Lambda 패키지 또는 로컬)
-        credentials_file = DATA_DIR / "bjchoi_service_account.json"
-        if not credentials_file.exists():
-            # 로컬 개발용 fallback
-            credentials_file = Path(__file__).parent.parent.parent / "bjchoi-n8n-031b26347c91.json"
-        credentials = service_account.Credentials.from_service_account_file(
-            str(credentials_file),
-            scopes=SCOPES
-        )
-
-    return build("drive", "v3", credentials=credentials, cache_discovery=False)
+        credentials = json.loads(credentials_json)
+        return credentials if isinstance(credentials, list) else [credentials]
+
+    credentials_dir = os.environ.get("GOOGLE_CREDENTIALS_DIR")
+    if credentials_dir:
+        credentials_path = Path(credentials_dir)
+        if not credentials_path.is_absolute():
+            credentials_path = DATA_DIR.parent / credentials_path
+        pool = []
+        for credentials_file in sorted(credentials_path.glob("*.json")):
+            with open(credentials_file, "r", encoding="utf-8") as f:
+                pool.append(json.load(f))
+        if pool:
+            return pool
+
+    # 파일에서 credentials (Lambda 패키지 또는 로컬)
+    credentials_file = DATA_DIR / "bjchoi_service_account.json"
+    if not credentials_file.exists():
+        # 로컬 개발용 fallback
+        credentials_file = Path(__file__).parent.parent.parent / "bjchoi-n8n-031b26347c91.json"
+    with open(credentials_file, "r", encoding="utf-8") as f:
+        return [json.load(f)]
+
+
+def load_credentials_info() -> dict:
+    """기본 Service Account credentials 로드."""
+    return load_credentials_pool()[0]
+
+
+def get_account_pool() -> AccountPool:
+    """서비스 계정 풀 (컨테이너 재사용 시 토큰/커넥션/제한 상태 재사용)."""
+    global _account_pool
+    with _account_pool_lock:
+        if _account_pool is None:
+            _account_pool = AccountPool([
+                Account(info.get("client_email", f"account-{i}"), DriveClient(info, SCOPES))
+                for i, info in enumerate(load_credentials_pool())
+            ])
+        return _account_pool
+
+
+def get_drive_client() -> DriveClient:
+    """조회용 경량 Drive 클라이언트 (풀의 기본 계정)."""
+    return get_account_pool().primary.client
 
 
 def load_folders() -> dict[str, str]:
@@ -59,15 +99,15 @@ def load_users() -> list[str]:
         ]
 
 
-def get_week_folder_id(batch: str, week: int) -> str | None:
-    """특정 기수의 주차 폴더 ID 조회.
+def get_week_folder(batch: str, week: int) -> dict | None:
+    """특정 기수의 주차 폴더 조회.
 
     Args:
         batch: 기수 (예: "3기")
         week: 주차 (예: 3)
 
     Returns:
-        폴더 ID 또는 None
+        폴더 정보 (id, name, modifiedTime) 또는 None
     """
     folders = load_folders()
     batch_folder_id = folders.get(batch)
@@ -75,34 +115,110 @@ def get_week_folder_id(batch: str, week: int) -> str | None:
     if not batch_folder_id:
         return None
 
-    service = get_drive_service()
+    client = get_drive_client()
     week_name = f"{week}주차"
 
     query = f"'{batch_folder_id}' in parents and name = '{week_name}' and mimeType = 'application/vnd.google-apps.folder'"
 
-    results = service.files().list(
-        q=query,
-        fields="files(id, name)",
-        supportsAllDrives=True,
-        includeItemsFromAllDrives=True
-    ).execute()
+    results = get_breaker(DRIVE_READ).call(
+        client.list_files,
+        query,
+        fields="files(id, name, modifiedTime)",
+        is_failure=is_outage_error
+    )
 
     files = results.get("files", [])
-    return files[0]["id"] if files else None
+    return files[0] if files else None
 
 
-def grant_reader_permission(folder_id: str, email: str, max_retries: int = 3) -> dict:
-    """지정된 이메일에 Reader 권한 부여 (지수 백오프 적용).
+def get_week_folder_id(batch: str, week: int) -> str | None:
+    """특정 기수의 주차 폴더 ID 조회.
+
+    Args:
+        batch: 기수 (예: "3기")
+        week: 주차 (예: 3)
+
+    Returns:
+        폴더 ID 또는 None
+    """
+    folder = get_week_folder(batch, week)
+    return folder["id"] if folder else None
+
+
+def get_permission_ids(folder_id: str) -> dict[str, str]:
+    """폴더 권한의 이메일(소문자) → 권한 ID 매핑."""
+    permissions = get_breaker(DRIVE_READ).call(
+        get_drive_client().list_permissions,
+        folder_id,
+        is_failure=is_outage_error
+    )
+    return {
+        p["emailAddress"].lower(): p["id"] for p in permissions
+        if p.get("emailAddress")
+    }
+
+
+def get_shared_emails(folder_id: str) -> set[str]:
+    """폴더에 이미 권한이 있는 이메일 목록 (소문자)."""
+    return set(get_permission_ids(folder_id))
+
+
+def revoke_permission(folder_id: str, permission_id: str) -> dict:
+    """폴더 권한 삭제."""
+    return get_breaker(DRIVE_WRITE).call(
+        get_drive_client().delete_permission,
+        folder_id,
+        permission_id,
+        is_failure=is_outage_error
+    )
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """rate limit 에러 여부 (rateLimitExceeded, userRateLimitExceeded, sharingRateLimitExceeded, 429)."""
+    if isinstance(error, DriveApiError) and error.status == 429:
+        return True
+    return "ratelimitexceeded" in str(error).lower()
+
+
+def is_outage_error(error: Exception) -> bool:
+    """Drive 장애로 볼 에러인지 판단 (서킷 브레이커 실패 기록용).
+
+    5xx와 네트워크 에러만 장애로 봅니다.
+    rate limit은 응답마다 기록하지 않고 재시도를 모두 소진한 경우에만 실패로 기록하며
+    (grant_reader_permission), 잘못된 이메일 등 요청 단위 4xx 에러와 이미 권한이 있는 경우는 제외합니다.
+    """
+    if is_rate_limit_error(error):
+        return False
+    if "already has access" in str(error).lower():
+        return False
+    if isinstance(error, DriveApiError):
+        return error.status >= 500
+    return True
+
+
+def needs_notification(email: str) -> bool:
+    """Drive 공유 알림 대상 여부 (Gmail은 알림 안 보냄, 그 외(네이버 등)는 알림 발송)."""
+    return not email.lower().endswith("@gmail.com")
+
+
+def grant_reader_permission(
+    folder_id: str,
+    email: str,
+    max_retries: int = 3,
+    notify: bool | None = None
+) -> dict:
+    """지정된 이메일에 Reader 권한 부여 (계정 풀 배정, 지수 백오프 적용).
 
     Args:
         folder_id: 폴더 ID
         email: 권한을 부여할 이메일
         max_retries: 최대 재시도 횟수
+        notify: Drive 알림 메일 발송 여부 (None이면 needs_notification 기준)
 
     Returns:
         생성된 권한 정보
     """
-    service = get_drive_service()
+    pool = get_account_pool()
 
     permission = {
         "type": "user",
@@ -110,59 +226,60 @@ def grant_reader_permission(folder_id: str, email: str, max_retries: int = 3) ->
         "emailAddress": email
     }
 
-    # Gmail은 알림 안 보냄, 그 외(네이버 등)는 알림 발송
-    send_notification = not email.lower().endswith("@gmail.com")
+    send_notification = needs_notification(email) if notify is None else notify
 
-    for attempt in range(max_retries):
-        try:
-            result = service.permissions().create(
-                fileId=folder_id,
-                body=permission,
-                sendNotificationEmail=send_notification,
-                supportsAllDrives=True
-            ).execute()
-            time.sleep(0.5)  # 기본 딜레이 0.5초
-            return result
-        except Exception as e:
-            if "rateLimitExceeded" in str(e) or "sharingRateLimitExceeded" in str(e):
-                wait_time = 6 if attempt == 0 else 9  # 6초, 9초
-                time.sleep(wait_time)
-                continue
-            raise
+    breaker = get_breaker(DRIVE_WRITE)
 
+    for attempt in range(max_retries):
+        with pool.account() as account:
+            try:
+                result = breaker.call(
+                    account.client.create_permission,
+                    folder_id,
+                    permission,
+                    send_notification=send_notification,
+                    is_failure=is_outage_error,
+                    is_ignored=is_rate_limit_error
+                )
+                time.sleep(0.5)  # 기본 딜레이 0.5초
+                return result
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    # 제한된 계정은 대기 시간 동안 배정 제외, 다른 계정이 있으면 바로 재시도
+                    wait_time = 6 if attempt == 0 else 9  # 6초, 9초
+                    pool.mark_throttled(account, wait_time)
+                    continue
+                raise
+
+    # 재시도로도 풀리지 않는 rate limit은 1건의 장애로 기록 (계속되면 회로 차단)
+    breaker.record_failure()
     raise Exception(f"Rate limit 재시도 초과: {email}")
 
 
-def share_week_folders(
+def get_target_folders(
+    folders: dict[str, str],
     week: int,
     current_batch: int,
     min_batch: int = 3,
     is_last_week: bool = False
-) -> dict:
-    """기수별 주차 폴더 공유.
+) -> list[tuple[str, int]]:
+    """주차별 공유 대상 (기수, 주차) 목록.
 
-    - 현재 기수: N주차 공유
-    - 이전 기수: N+1주차 공유 (마지막 주차면 N주차)
+    - 현재 기수: N주차
+    - 이전 기수: N+1주차 (마지막 주차면 제외)
 
     Args:
+        folders: 기수별 폴더 ID
         week: 현재 기수 기준 주차
         current_batch: 현재 운영 기수
         min_batch: 최소 기수 (기본값 3, 1~2기 제외)
-        is_last_week: 마지막 주차 여부 (True면 모든 기수 같은 주차 공유)
+        is_last_week: 마지막 주차 여부 (True면 현재 기수만)
 
     Returns:
-        공유 결과 (기수별 폴더 링크)
+        (기수, 주차) 리스트
     """
-    folders = load_folders()
-    users = load_users()
-
-    results = {
-        "week": week,
-        "shared_folders": [],
-        "errors": []
-    }
-
-    for batch_name, _ in folders.items():
+    targets = []
+    for batch_name in folders:
         batch_num = int(batch_name.replace("기", ""))
 
         # 최소 기수 미만 제외 (1~2기)
@@ -178,38 +295,181 @@ def share_week_folders(
             continue
 
         # 현재 기수는 N주차, 이전 기수는 N+1주차
-        target_week = week if batch_num == current_batch else week + 1
+        targets.append((batch_name, week if batch_num == current_batch else week + 1))
 
-        # 주차 폴더 ID 조회
-        week_folder_id = get_week_folder_id(batch_name, target_week)
+    return targets
 
-        if not week_folder_id:
-            results["errors"].append({
-                "batch": batch_name,
-                "error": f"{target_week}주차 폴더 없음"
-            })
-            continue
 
-        # 각 사용자에게 권한 부여
-        for email in users:
-            try:
-                grant_reader_permission(week_folder_id, email)
-            except Exception as e:
-                # 이미 권한이 있는 경우 등 에러 무시
-                if "already has access" not in str(e).lower():
-                    results["errors"].append({
-                        "batch": batch_name,
-                        "email": email,
-                        "error": str(e)
-                    })
-
-        # 폴더 링크 추가
-        folder_link = f"https://drive.google.com/drive/folders/{week_folder_id}"
-        results["shared_folders"].append({
+def is_past_deadline(deadline: float | None) -> bool:
+    """공유 마감 시각(time.monotonic 기준)이 지났는지."""
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def share_folder(
+    batch_name: str,
+    target_week: int,
+    users: list[str],
+    errors: ErrorAggregator,
+    digest=None,
+    deadline: float | None = None
+) -> dict:
+    """기수 1개의 주차 폴더를 사용자들에게 공유.
+
+    Args:
+        batch_name: 기수 (예: "3기")
+        target_week: 공유할 주차
+        users: 공유 대상 이메일 목록
+        errors: 에러 집계기
+        digest: NotificationDigest (주어지면 알림 없이 공유하고 알림 대상 링크를 모음)
+        deadline: 새 권한 부여를 시작하지 않을 시각 (time.monotonic 기준, None이면 제한 없음)
+
+    Returns:
+        처리 결과 (공유 폴더 정보 또는 None, 미처리 작업)
+    """
+    outcome = {
+        "shared_folder": None,
+        "pending": []
+    }
+
+    # 미처리 작업은 건수만 기록 (재실행 시 이미 권한이 있는 사용자는 건너뜀)
+    def add_pending(folder_id: str | None, count: int, reason: str) -> None:
+        outcome["pending"].append({
             "batch": batch_name,
             "week": target_week,
-            "folder_id": week_folder_id,
-            "link": folder_link
+            "folder_id": folder_id,
+            "count": count,
+            "reason": reason
         })
 
+    if is_past_deadline(deadline):
+        add_pending(None, len(users), "deadline")
+        errors.add(f"실행 시간 한도 - {len(users)}명 미처리", batch=batch_name, week=target_week)
+        return outcome
+
+    # 주차 폴더 ID 조회 (Drive 읽기 차단 시 조회하지 않고 미처리로 기록)
+    try:
+        week_folder = get_week_folder(batch_name, target_week)
+    except CircuitOpenError as e:
+        add_pending(None, len(users), "circuit_open")
+        errors.add(str(e), batch=batch_name, week=target_week)
+        return outcome
+
+    if not week_folder:
+        errors.add(f"{target_week}주차 폴더 없음", batch=batch_name, week=target_week)
+        return outcome
+
+    week_folder_id = week_folder["id"]
+    folder_link = f"https://drive.google.com/drive/folders/{week_folder_id}"
+
+    # 이미 권한이 있는 사용자는 권한 부여 생략 (조회 실패 시 전체 시도)
+    try:
+        shared_emails = get_shared_emails(week_folder_id)
+    except Exception:
+        shared_emails = set()
+    targets = [email for email in users if email.lower() not in shared_emails]
+
+    # 각 사용자에게 권한 부여 (다이제스트 모드면 알림 없이 공유)
+    for i, email in enumerate(targets):
+        # Lambda 시간 한도 전에 남은 사용자는 미처리로 넘겨 결과 보고/저장 시간 확보
+        if is_past_deadline(deadline):
+            unattempted = len(targets) - i
+            add_pending(week_folder_id, unattempted, "deadline")
+            errors.add(f"실행 시간 한도 - {unattempted}명 미처리", batch=batch_name, week=target_week)
+            return outcome
+
+        try:
+            if digest is None:
+                grant_reader_permission(week_folder_id, email)
+            else:
+                grant_reader_permission(week_folder_id, email, notify=False)
+                if needs_notification(email):
+                    digest.add(email, batch_name, target_week, folder_link)
+        except CircuitOpenError as e:
+            # Drive 쓰기 차단: 남은 사용자는 시도하지 않고 에러 1건만 기록
+            # 공유가 끝나지 않은 폴더는 안내하지 않음
+            unattempted = len(targets) - i
+            add_pending(week_folder_id, unattempted, "circuit_open")
+            errors.add(f"{e} - {unattempted}명 미처리", batch=batch_name, week=target_week)
+            return outcome
+        except Exception as e:
+            # 이미 권한이 있는 경우 등 에러 무시
+            if "already has access" not in str(e).lower():
+                errors.add(str(e), batch=batch_name, email=email, week=target_week)
+
+    # 폴더 링크 추가
+    outcome["shared_folder"] = {
+        "batch": batch_name,
+        "week": target_week,
+        "folder_id": week_folder_id,
+        "modified_time": week_folder.get("modifiedTime"),
+        "link": folder_link
+    }
+    return outcome
+
+
+def share_week_folders(
+    week: int,
+    current_batch: int,
+    min_batch: int = 3,
+    is_last_week: bool = False,
+    digest=None,
+    deadline: float | None = None
+) -> dict:
+    """기수별 주차 폴더 공유.
+
+    - 현재 기수: N주차 공유
+    - 이전 기수: N+1주차 공유 (마지막 주차면 N주차)
+
+    Args:
+        week: 현재 기수 기준 주차
+        current_batch: 현재 운영 기수
+        min_batch: 최소 기수 (기본값 3, 1~2기 제외)
+        is_last_week: 마지막 주차 여부 (True면 모든 기수 같은 주차 공유)
+        digest: NotificationDigest (주어지면 알림 없이 공유하고 알림 대상 링크를 모음)
+        deadline: 새 권한 부여를 시작하지 않을 시각 (time.monotonic 기준, None이면 제한 없음)
+
+    Returns:
+        공유 결과 (기수별 폴더 링크, 에러 요약, 회로 차단/시간 한도로 미처리된 작업)
+    """
+    folders = load_folders()
+    users = load_users()
+
+    results = {
+        "week": week,
+        "shared_folders": [],
+        "errors": [],
+        "pending": []
+    }
+    targets = get_target_folders(folders, week, current_batch, min_batch, is_last_week)
+    errors = ErrorAggregator(f"share_week{week}")
+
+    # 컨테이너 재사용 시 풀의 누적 횟수가 남아 있으므로 이번 실행 증가분만 보고
+    pool = get_account_pool()
+    pool_baseline = pool.stats()
+
+    # 계정이 여러 개면 폴더별로 동시에 처리 (계정 수만큼)
+    workers = min(pool.size, len(targets))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(
+                lambda target: share_folder(target[0], target[1], users, errors, digest, deadline),
+                targets
+            ))
+    else:
+        outcomes = [
+            share_folder(batch_name, target_week, users, errors, digest, deadline)
+            for batch_name, target_week in targets
+        ]
+
+    for outcome in outcomes:
+        results["pending"].extend(outcome["pending"])
+        if outcome["shared_folder"]:
+            results["shared_folders"].append(outcome["shared_folder"])
+
+    # 에러는 (유형, 기수)별 요약만 반환, 전체 내역은 JSONL 파일
+    results["errors"] = errors.summary()
+    results["error_count"] = errors.total
+    results["error_artifact"] = str(errors.artifact_path) if errors.artifact_path else None
+    results["accounts"] = pool.stats(since=pool_baseline)
+
     return results
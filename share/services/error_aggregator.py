@@ -0,0 +1,155 @@
+"""대량 실행용 에러 집계.
+
+실패를 (유형, 기수) 단위로 묶어 건수와 일부 샘플만 메모리에 보관하고,
+전체 상세 내역은 로컬 JSONL 파일에 기록합니다.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# 전체 에러 상세 기록 경로
+ERROR_ARTIFACT_DIR = Path(os.environ.get("SHARE_ERROR_DIR", "/tmp/share_errors"))
+
+# 그룹별 보관 샘플 수
+DEFAULT_SAMPLE_SIZE = 3
+
+# 샘플 에러 메시지 최대 길이
+MAX_MESSAGE_LENGTH = 200
+
+# Block Kit 요약에 표시할 최대 그룹 수
+MAX_SUMMARY_GROUPS = 10
+
+# 에러 유형 (메시지 패턴 → 유형)
+ERROR_TYPES = [
+    ("회로 차단", "circuit_open"),
+    ("실행 시간 한도", "deadline"),
+    ("RateLimitExceeded", "rate_limit"),
+    ("rateLimitExceeded", "rate_limit"),
+    ("Rate limit", "rate_limit"),
+    ("폴더 없음", "folder_missing"),
+    ("notFound", "not_found"),
+    ("HttpError 404", "not_found"),
+    ("HttpError 403", "permission"),
+    ("insufficientFilePermissions", "permission"),
+    ("invalidSharingRequest", "invalid_request"),
+]
+
+
+def classify_error(message: str) -> str:
+    """에러 메시지로 유형 판단."""
+    for pattern, error_type in ERROR_TYPES:
+        if pattern in message:
+            return error_type
+    return "other"
+
+
+class ErrorAggregator:
+    """(유형, 기수)별 건수 + 샘플만 보관하는 에러 집계기 (스레드 안전)."""
+
+    def __init__(self, name: str = "share", sample_size: int = DEFAULT_SAMPLE_SIZE, artifact_dir: Path | None = None):
+        self.sample_size = sample_size
+        self.total = 0
+        self._groups: dict[tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        self._artifact_dir = artifact_dir or ERROR_ARTIFACT_DIR
+        self.artifact_path: Path | None = None
+        self._name = f"{name}_{time.strftime('%Y%m%dT%H%M%S')}_{os.getpid()}"
+
+    def add(self, error: str, batch: str | None = None, email: str | None = None, **detail) -> None:
+        """에러 1건 추가."""
+        message = str(error)
+        error_type = classify_error(message)
+        key = (error_type, batch or "-")
+
+        with self._lock:
+            self.total += 1
+            group = self._groups.setdefault(key, {
+                "type": error_type,
+                "batch": batch,
+                "count": 0,
+                "samples": []
+            })
+            group["count"] += 1
+            if len(group["samples"]) < self.sample_size:
+                sample = {"error": message[:MAX_MESSAGE_LENGTH]}
+                if email:
+                    sample["email"] = email
+                group["samples"].append(sample)
+
+            self._write_detail({"type": error_type, "batch": batch, "email": email, "error": message, **detail})
+
+    def _write_detail(self, record: dict) -> None:
+        """전체 상세 내역을 JSONL로 기록 (실패해도 무시)."""
+        try:
+            if self.artifact_path is None:
+                self._artifact_dir.mkdir(parents=True, exist_ok=True)
+                self.artifact_path = self._artifact_dir / f"{self._name}.jsonl"
+            with open(self.artifact_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError:
+            pass
+
+    def summary(self) -> list[dict]:
+        """건수 많은 순 그룹 목록."""
+        with self._lock:
+            groups = [
+                {**group, "samples": list(group["samples"])}
+                for group in self._groups.values()
+            ]
+        return sorted(groups, key=lambda g: g["count"], reverse=True)
+
+    def __len__(self) -> int:
+        return self.total
+
+
+def render_error_text(summary: list[dict], total: int, max_groups: int = MAX_SUMMARY_GROUPS) -> str:
+    """에러 요약 문구 (그룹별 1줄)."""
+    lines = [f"오류 {total}건"]
+    for group in summary[:max_groups]:
+        sample = group["samples"][0]["error"] if group["samples"] else ""
+        lines.append(f"• {group['batch'] or '-'} {group['type']} {group['count']}건: {sample}")
+    if len(summary) > max_groups:
+        lines.append(f"• 외 {len(summary) - max_groups}개 유형")
+    return "\n".join(lines)
+
+
+def render_error_blocks(
+    title: str,
+    summary: list[dict],
+    total: int,
+    max_groups: int = MAX_SUMMARY_GROUPS
+) -> dict:
+    """에러 요약 Block Kit 메시지.
+
+    상세 기록(JSONL)은 프로세서 /tmp에만 있어 관리자가 열 수 없으므로 경로는 표시하지 않습니다.
+    """
+    lines = []
+    for group in summary[:max_groups]:
+        line = f"• *{group['batch'] or '-'}* `{group['type']}` {group['count']}건"
+        if group["samples"]:
+            line += f"\n    예: {group['samples'][0]['error']}"
+        lines.append(line)
+    if len(summary) > max_groups:
+        lines.append(f"• 외 {len(summary) - max_groups}개 유형")
+
+    blocks = [
+        {
+            "type": "header",
+            "text": {"type": "plain_text", "text": f"⚠️ {title}"[:150], "emoji": True}
+        },
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "\n".join(lines)[:2900] or "-"}
+        }
+    ]
+
+    context = f"총 {total}건, {len(summary)}개 유형"
+    blocks.append({
+        "type": "context",
+        "elements": [{"type": "mrkdwn", "text": context}]
+    })
+
+    return {"blocks": blocks, "text": f"⚠️ {title} (오류 {total}건)"}
@@ -0,0 +1,141 @@
+"""주차 폴더 영상 목록(매니페스트) 서비스.
+
+공유된 주차 폴더의 영상 목록을 기수별로 동시에 조회하고,
+폴더 ID + modifiedTime 기준으로 캐시해 변경이 없는 폴더는 다시 조회하지 않습니다.
+캐시는 실행 결과 저장소에 {폴더 ID: {modified_time, titles}} 상태 1건으로 보관해
+콜드 스타트 후에도 유지됩니다.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from services.circuit_breaker import DRIVE_READ, get_breaker
+from services.drive_service import get_drive_client, is_outage_error
+from services.run_store import get_run_store
+
+logger = logging.getLogger()
+
+# 매니페스트 캐시 상태 이름
+MANIFEST_STATE = "video_manifest"
+
+# 캐시에 보관할 최대 폴더 수 (최근 사용 순, DynamoDB 항목 크기 제한 대비)
+MAX_CACHED_FOLDERS = 60
+
+# 전체 매니페스트 조회 시간 한도 (초) - 초과한 폴더는 영상 정보 없이 안내
+DEFAULT_MANIFEST_TIMEOUT = 5.0
+
+# 동시에 조회할 최대 폴더 수
+MANIFEST_MAX_WORKERS = 8
+
+# files.list 페이지 크기 (최대 1000)
+MANIFEST_PAGE_SIZE = 1000
+
+
+def load_manifest_cache() -> dict[str, dict]:
+    """폴더별 캐시 (조회 실패 시 빈 dict)."""
+    try:
+        return get_run_store().load_state(MANIFEST_STATE) or {}
+    except Exception as e:
+        logger.warning(f"영상 목록 캐시 조회 실패: {e}")
+        return {}
+
+
+def save_manifest_cache(cache: dict[str, dict]) -> None:
+    """폴더별 캐시 저장 (최근 MAX_CACHED_FOLDERS개만, 실패해도 무시)."""
+    recent = dict(list(cache.items())[-MAX_CACHED_FOLDERS:])
+    try:
+        get_run_store().save_state(MANIFEST_STATE, recent)
+    except Exception as e:
+        logger.warning(f"영상 목록 캐시 저장 실패: {e}")
+
+
+def get_cached_titles(cache: dict[str, dict], folder: dict) -> list[str] | None:
+    """캐시된 영상 제목 목록 (modifiedTime이 다르면 None)."""
+    cached = cache.get(folder["folder_id"])
+    if not cached or not folder.get("modified_time"):
+        return None
+    if cached.get("modified_time") != folder["modified_time"]:
+        return None
+    return cached.get("titles")
+
+
+def list_folder_videos(folder_id: str) -> list[str]:
+    """폴더의 영상 제목 목록 (필요한 필드만, 페이지 단위 조회)."""
+    client = get_drive_client()
+    breaker = get_breaker(DRIVE_READ)
+    query = f"'{folder_id}' in parents and mimeType contains 'video/' and trashed = false"
+
+    titles = []
+    page_token = None
+    while True:
+        result = breaker.call(
+            client.list_files,
+            query,
+            fields="nextPageToken, files(name)",
+            page_token=page_token,
+            page_size=MANIFEST_PAGE_SIZE,
+            is_failure=is_outage_error
+        )
+        titles.extend(f["name"] for f in result.get("files", []))
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return sorted(titles)
+
+
+def attach_video_manifests(shared_folders: list[dict], timeout: float | None = None) -> None:
+    """공유 폴더 정보에 영상 수(video_count)와 제목(video_titles)을 추가.
+
+    시간 한도 내에 조회하지 못했거나 실패한 폴더는 그대로 둡니다.
+
+    Args:
+        shared_folders: share_week_folders 결과의 shared_folders (직접 수정)
+        timeout: 전체 조회 시간 한도 (초)
+    """
+    if not shared_folders:
+        return
+
+    if timeout is None:
+        timeout = float(os.environ.get("MANIFEST_TIMEOUT", DEFAULT_MANIFEST_TIMEOUT))
+
+    # 캐시는 한 번만 읽고 조회가 끝난 뒤 한 번만 저장 (스레드별 저장 경합 방지)
+    cache = load_manifest_cache()
+    misses = []
+    for folder in shared_folders:
+        titles = get_cached_titles(cache, folder)
+        if titles is None:
+            misses.append(folder)
+            continue
+        folder["video_count"] = len(titles)
+        folder["video_titles"] = titles
+        # 최근 사용 순서 유지
+        cache[folder["folder_id"]] = cache.pop(folder["folder_id"])
+
+    if not misses:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(MANIFEST_MAX_WORKERS, len(misses)))
+    futures = {executor.submit(list_folder_videos, folder["folder_id"]): folder for folder in misses}
+    done, not_done = wait(futures, timeout=timeout)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    updated = False
+    for future in done:
+        folder = futures[future]
+        try:
+            titles = future.result()
+        except Exception as e:
+            logger.warning(f"영상 목록 조회 실패 ({folder['batch']} {folder['week']}주차): {e}")
+            continue
+        folder["video_count"] = len(titles)
+        folder["video_titles"] = titles
+        if folder.get("modified_time"):
+            cache.pop(folder["folder_id"], None)
+            cache[folder["folder_id"]] = {"modified_time": folder["modified_time"], "titles": titles}
+            updated = True
+
+    if updated:
+        save_manifest_cache(cache)
+
+    if not_done:
+        logger.warning(f"영상 목록 조회 시간 초과 ({timeout}초): {len(not_done)}개 폴더 생략")
@@ -0,0 +1,107 @@
+"""폴더 공유 알림 다이제스트 서비스."""
+
+import logging
+import os
+import threading
+
+logger = logging.getLogger()
+
+
+class NotificationDigest:
+    """실행 중 새로 공유된 폴더 링크를 사용자별로 모음."""
+
+    def __init__(self):
+        self._links: dict[str, list[dict]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, email: str, batch: str, week: int, link: str) -> None:
+        """사용자에게 새로 공유된 폴더 추가."""
+        with self._lock:
+            self._links.setdefault(email, []).append({
+                "batch": batch,
+                "week": week,
+                "link": link
+            })
+
+    def items(self) -> list[tuple[str, list[dict]]]:
+        """(이메일, 폴더 리스트) 목록."""
+        with self._lock:
+            return list(self._links.items())
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+
+def render_digest(folders: list[dict]) -> tuple[str, str]:
+    """다이제스트 메일 제목/본문 생성."""
+    weeks = sorted({f["week"] for f in folders})
+    subject = f"[강의 영상] {', '.join(f'{w}주차' for w in weeks)} 영상 폴더가 공유되었습니다"
+    lines = [f"- {f['batch']} {f['week']}주차: {f['link']}" for f in folders]
+    body = "아래 강의 영상 폴더에 접근할 수 있습니다.\n\n" + "\n".join(lines)
+    return subject, body
+
+
+def ses_sender(email: str, folders: list[dict]) -> None:
+    """SES로 다이제스트 메일 발송 (NOTIFY_FROM_EMAIL 필요)."""
+    import boto3
+
+    from_email = os.environ.get("NOTIFY_FROM_EMAIL")
+    if not from_email:
+        raise ValueError("NOTIFY_FROM_EMAIL 환경변수가 설정되지 않았습니다.")
+
+    subject, body = render_digest(folders)
+    boto3.client("ses").send_email(
+        Source=from_email,
+        Destination={"ToAddresses": [email]},
+        Message={
+            "Subject": {"Data": subject, "Charset": "UTF-8"},
+            "Body": {"Text": {"Data": body, "Charset": "UTF-8"}}
+        }
+    )
+
+
+class StubSender:
+    """로컬 테스트용 발송기 (발송 내용을 보관만 함)."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+
+    def __call__(self, email: str, folders: list[dict]) -> None:
+        subject, body = render_digest(folders)
+        self.sent.append({"email": email, "subject": subject, "body": body})
+        logger.info(f"[stub] 다이제스트 발송: {email} ({len(folders)}개 폴더)")
+
+
+def get_sender():
+    """NOTIFY_SENDER 환경변수에 따른 발송기 (기본값 ses)."""
+    if os.environ.get("NOTIFY_SENDER", "ses").lower() == "stub":
+        return StubSender()
+    return ses_sender
+
+
+def is_digest_mode() -> bool:
+    """SHARE_NOTIFY_MODE=digest 여부."""
+    return os.environ.get("SHARE_NOTIFY_MODE", "").lower() == "digest"
+
+
+def send_digests(digest: NotificationDigest, sender=None) -> dict:
+    """사용자별 다이제스트 1건씩 발송.
+
+    Args:
+        digest: 실행 중 모은 다이제스트
+        sender: (이메일, 폴더 리스트)를 받아 발송하는 함수 (기본값 get_sender())
+
+    Returns:
+        발송 결과 (발송 수, 에러 목록)
+    """
+    sender = sender or get_sender()
+    result = {"sent": 0, "errors": []}
+
+    for email, folders in digest.items():
+        try:
+            sender(email, folders)
+            result["sent"] += 1
+        except Exception as e:
+            result["errors"].append({"email": email, "error": str(e)})
+
+    return result
@@ -0,0 +1,180 @@
+"""프로세서 호출 프로파일링 (cProfile + tracemalloc).
+
+이벤트에 "profile": true를 넣거나 SHARE_PROFILE=1 환경변수를 설정하면 활성화됩니다.
+비활성화 상태에서는 원래 함수를 그대로 호출합니다.
+
+cProfile은 호출한 스레드만 측정하므로, 실행 중 새로 시작된 스레드(스레드 풀 작업)마다
+프로파일을 따로 켜고 종료 시 하나의 통계로 합칩니다.
+(Python 3.12+는 프로파일러 하나가 모든 스레드를 기록하지만 스레드 간 시간이 섞여 부정확합니다.
+Lambda 런타임은 3.11입니다.)
+"""
+
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+logger = logging.getLogger()
+
+# 프로파일 결과 저장 경로
+PROFILE_DIR = Path(os.environ.get("SHARE_PROFILE_DIR", "/tmp/share_profiles"))
+
+# 로그에 남길 상위 항목 수
+PROFILE_TOP_N = 15
+
+
+def is_profiling_enabled(event: dict) -> bool:
+    """이벤트 필드 또는 환경변수로 프로파일링 활성화 여부 판단."""
+    if isinstance(event, dict) and event.get("profile"):
+        return True
+    return os.environ.get("SHARE_PROFILE", "").lower() in ("1", "true", "yes")
+
+
+def s3_uploader(paths: list[Path]) -> None:
+    """프로파일 결과를 S3에 업로드 (SHARE_PROFILE_BUCKET 필요)."""
+    import boto3
+
+    bucket = os.environ.get("SHARE_PROFILE_BUCKET")
+    if not bucket:
+        raise ValueError("SHARE_PROFILE_BUCKET 환경변수가 설정되지 않았습니다.")
+
+    client = boto3.client("s3")
+    for path in paths:
+        client.upload_file(str(path), bucket, f"profiles/{path.name}")
+
+
+def get_uploader():
+    """SHARE_PROFILE_UPLOADER 환경변수에 따른 업로더 (기본값 없음: 로컬 저장만)."""
+    if os.environ.get("SHARE_PROFILE_UPLOADER", "").lower() == "s3":
+        return s3_uploader
+    return None
+
+
+def start_thread_profiling(profiles: list[cProfile.Profile]):
+    """이후 시작되는 스레드마다 프로파일을 켜는 훅 설치.
+
+    Args:
+        profiles: 스레드별 프로파일을 모을 리스트
+
+    Returns:
+        threading.setprofile에 설치한 훅
+    """
+
+    def hook(frame, event, arg):
+        # 훅은 스레드 시작 시 1번만 필요하므로 바로 해제
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+: 프로파일러가 하나만 허용되며 기존 프로파일이 모든 스레드를 측정
+            return
+        profiles.append(profile)
+
+    threading.setprofile(hook)
+    return hook
+
+
+def merge_profiles(profile: cProfile.Profile, thread_profiles: list[cProfile.Profile]) -> pstats.Stats:
+    """메인 스레드와 작업 스레드 프로파일을 하나의 통계로 합침."""
+    stats = pstats.Stats(profile)
+    for thread_profile in thread_profiles:
+        thread_profile.create_stats()
+        if thread_profile.stats:
+            stats.add(thread_profile)
+    return stats
+
+
+def format_top_functions(stats: pstats.Stats, top_n: int = PROFILE_TOP_N) -> str:
+    """누적 시간 기준 상위 함수 요약."""
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats("cumulative").print_stats(top_n)
+    return stream.getvalue()
+
+
+def format_top_allocations(snapshot: tracemalloc.Snapshot, top_n: int = PROFILE_TOP_N) -> str:
+    """할당 크기 기준 상위 위치 요약."""
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__)
+    ])
+    lines = []
+    for stat in snapshot.statistics("lineno")[:top_n]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:.1f} KiB ({stat.count}건) {frame.filename}:{frame.lineno}")
+    return "\n".join(lines)
+
+
+def write_artifacts(run_id: str, stats: pstats.Stats, functions: str, allocations: str, peak: int) -> list[Path]:
+    """프로파일(.prof)과 요약(.txt) 파일 저장."""
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+
+    profile_path = PROFILE_DIR / f"{run_id}.prof"
+    stats.dump_stats(str(profile_path))
+
+    summary_path = PROFILE_DIR / f"{run_id}.txt"
+    with open(summary_path, "w", encoding="utf-8") as f:
+        f.write(f"peak memory: {peak / 1024 / 1024:.1f} MiB\n\n")
+        f.write("== top functions (cumulative) ==\n")
+        f.write(functions)
+        f.write("\n== top allocations ==\n")
+        f.write(allocations)
+        f.write("\n")
+
+    return [profile_path, summary_path]
+
+
+def profile_invocation(func):
+    """Lambda 핸들러를 감싸 프로파일링 (활성화된 경우에만)."""
+
+    @functools.wraps(func)
+    def wrapper(event, context):
+        if not is_profiling_enabled(event):
+            return func(event, context)
+
+        run_id = time.strftime("%Y%m%dT%H%M%S") + f"-{os.getpid()}"
+        profile = cProfile.Profile()
+        thread_profiles: list[cProfile.Profile] = []
+        tracemalloc.start()
+        start = time.perf_counter()
+        start_thread_profiling(thread_profiles)
+        profile.enable()
+        try:
+            return func(event, context)
+        finally:
+            profile.disable()
+            threading.setprofile(None)
+            elapsed = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            # 프로파일링 실패가 원래 결과에 영향을 주지 않도록 처리
+            try:
+                stats = merge_profiles(profile, thread_profiles)
+                functions = format_top_functions(stats)
+                allocations = format_top_allocations(snapshot)
+                paths = write_artifacts(run_id, stats, functions, allocations, peak)
+
+                top_calls = format_top_functions(stats, top_n=5)
+                logger.info(
+                    f"Profile {run_id}: {elapsed:.2f}s ({len(thread_profiles)} worker threads), "
+                    f"peak {peak / 1024 / 1024:.1f} MiB, "
+                    f"artifacts {[str(p) for p in paths]}\n{top_calls}\n{allocations}"
+                )
+
+                uploader = get_uploader()
+                if uploader:
+                    uploader(paths)
+            except Exception as e:
+                logger.warning(f"프로파일 저장 실패: {e}")
+
+    return wrapper
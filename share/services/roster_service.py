@@ -0,0 +1,195 @@
+"""수강생 명단 변경분 동기화 서비스.
+
+마지막으로 동기화한 명단 스냅샷과 현재 users.txt를 비교해
+- 추가된 사용자: 이번 학기 지금까지 공유된 폴더 권한 부여
+- 삭제된 사용자: 같은 폴더 권한 회수
+
+스냅샷은 실행 결과 저장소에 보관해 재배포/콜드 스타트 후에도 유지됩니다.
+"""
+
+from services.circuit_breaker import CircuitOpenError
+from services.error_aggregator import ErrorAggregator
+from services.drive_service import (
+    get_permission_ids,
+    get_target_folders,
+    get_week_folder_id,
+    grant_reader_permission,
+    load_folders,
+    load_users,
+    needs_notification,
+    revoke_permission,
+)
+from services.run_store import get_run_store
+
+# 저장소의 명단 스냅샷 상태 이름
+ROSTER_SNAPSHOT_STATE = "roster_snapshot"
+
+# 1회 실행당 최대 권한 변경 수
+DEFAULT_MAX_OPERATIONS = 500
+
+
+def load_roster_snapshot() -> list[str] | None:
+    """마지막 동기화 명단 (없으면 None).
+
+    저장소 조회 실패는 그대로 전파합니다 (스냅샷이 없는 것으로 보고 덮어쓰지 않도록).
+    """
+    state = get_run_store().load_state(ROSTER_SNAPSHOT_STATE)
+    return state["users"] if state else None
+
+
+def save_roster_snapshot(users: list[str]) -> None:
+    """명단 스냅샷 저장."""
+    get_run_store().save_state(ROSTER_SNAPSHOT_STATE, {"users": sorted(users)})
+
+
+def ensure_roster_snapshot(users: list[str]) -> bool:
+    """스냅샷이 없으면 현재 명단으로 생성. 생성했으면 True."""
+    if load_roster_snapshot() is not None:
+        return False
+    save_roster_snapshot(users)
+    return True
+
+
+def get_shared_targets(
+    weeks: list[int],
+    current_batch: int,
+    last_week: int,
+    min_batch: int = 3
+) -> list[tuple[str, int]]:
+    """지금까지 공유된 주차들의 (기수, 주차) 목록 (중복 제거)."""
+    folders = load_folders()
+    targets = []
+    for week in sorted(weeks):
+        for target in get_target_folders(folders, week, current_batch, min_batch, week == last_week):
+            if target not in targets:
+                targets.append(target)
+    return targets
+
+
+def finalize_errors(results: dict, errors: ErrorAggregator) -> dict:
+    """결과에 에러 요약 반영 (전체 내역은 JSONL 파일)."""
+    results["errors"] = errors.summary()
+    results["error_count"] = errors.total
+    results["error_artifact"] = str(errors.artifact_path) if errors.artifact_path else None
+    return results
+
+
+def sync_roster_delta(
+    weeks: list[int],
+    current_batch: int,
+    last_week: int,
+    max_operations: int = DEFAULT_MAX_OPERATIONS,
+    digest=None
+) -> dict:
+    """명단 변경분만 지금까지 공유된 폴더에 반영.
+
+    스냅샷이 없으면 현재 명단으로 스냅샷만 만들고 종료합니다.
+    처리가 끝난 사용자만 스냅샷에 반영하므로 중단되면 다음 실행에서 이어서 처리합니다.
+
+    Args:
+        weeks: 지금까지 공유된 주차 목록
+        current_batch: 현재 운영 기수
+        last_week: 마지막 주차
+        max_operations: 1회 실행당 최대 권한 변경 수
+        digest: NotificationDigest (주어지면 알림 없이 공유하고 알림 대상 링크를 모음)
+
+    Returns:
+        동기화 결과 (추가/삭제 사용자, 처리 폴더 수, 에러, 미처리 사용자)
+    """
+    users = load_users()
+    previous = load_roster_snapshot()
+
+    results = {
+        "added": [],
+        "removed": [],
+        "folders": 0,
+        "granted": 0,
+        "revoked": 0,
+        "errors": [],
+        "error_count": 0,
+        "remaining": []
+    }
+    errors = ErrorAggregator("roster_sync")
+
+    if previous is None:
+        save_roster_snapshot(users)
+        results["initialized"] = True
+        return results
+
+    previous_set = {email.lower() for email in previous}
+    current_set = {email.lower() for email in users}
+    added = [email for email in users if email.lower() not in previous_set]
+    removed = [email for email in previous if email.lower() not in current_set]
+    results["added"] = added
+    results["removed"] = removed
+
+    if not added and not removed:
+        return results
+
+    # 지금까지 공유된 폴더 ID 조회
+    folder_ids = []
+    for batch_name, week in get_shared_targets(weeks, current_batch, last_week):
+        try:
+            folder_id = get_week_folder_id(batch_name, week)
+        except CircuitOpenError as e:
+            errors.add(str(e), batch=batch_name, week=week)
+            return finalize_errors(results, errors)
+        if folder_id:
+            folder_ids.append((batch_name, week, folder_id))
+    results["folders"] = len(folder_ids)
+
+    operations = 0
+    done_added: list[str] = []
+    done_removed: list[str] = []
+    stopped = False
+    permission_ids: dict[str, dict[str, str]] = {}
+
+    # 사용자 단위로 모든 폴더 처리 (중간에 멈추면 해당 사용자는 다음 실행에서 재처리)
+    for email, action in [(e, "grant") for e in added] + [(e, "revoke") for e in removed]:
+        if stopped or operations + len(folder_ids) > max_operations:
+            results["remaining"].append(email)
+            continue
+
+        user_ok = True
+        for batch_name, week, folder_id in folder_ids:
+            try:
+                if action == "grant" and digest is None:
+                    grant_reader_permission(folder_id, email)
+                    results["granted"] += 1
+                elif action == "grant":
+                    grant_reader_permission(folder_id, email, notify=False)
+                    if needs_notification(email):
+                        digest.add(email, batch_name, week, f"https://drive.google.com/drive/folders/{folder_id}")
+                    results["granted"] += 1
+                else:
+                    if folder_id not in permission_ids:
+                        permission_ids[folder_id] = get_permission_ids(folder_id)
+                    permission_id = permission_ids[folder_id].get(email.lower())
+                    if permission_id:
+                        revoke_permission(folder_id, permission_id)
+                        results["revoked"] += 1
+            except CircuitOpenError as e:
+                errors.add(str(e), batch=batch_name, email=email, week=week)
+                user_ok = False
+                stopped = True
+                break
+            except Exception as e:
+                if "already has access" in str(e).lower():
+                    continue
+                errors.add(str(e), batch=batch_name, email=email, week=week, action=action)
+                user_ok = False
+            operations += 1
+
+        if not user_ok:
+            results["remaining"].append(email)
+        elif action == "grant":
+            done_added.append(email)
+        else:
+            done_removed.append(email)
+
+    # 처리 완료된 변경분만 스냅샷에 반영
+    done_removed_set = {email.lower() for email in done_removed}
+    snapshot = [email for email in previous if email.lower() not in done_removed_set] + done_added
+    save_roster_snapshot(snapshot)
+
+    return finalize_errors(results, errors)
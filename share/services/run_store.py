@@ -0,0 +1,203 @@
+"""공유 실행 결과 저장소.
+
+process_handler 실행 결과를 저장하고 /share status 조회에 사용합니다.
+실행 간 유지해야 하는 상태(명단 동기화 기준 등)도 함께 저장합니다.
+- sqlite (기본값): 로컬/단일 컨테이너용
+- dynamodb: RUN_TABLE_NAME 테이블 (파티션 키 week(Number), 정렬 키 finished_at(String)),
+  STATE_TABLE_NAME 테이블 (파티션 키 name(String))
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+# 상태 저장 경로
+STATE_DIR = Path(os.environ.get("SHARE_STATE_DIR", "/tmp/share_state"))
+RUN_DB_FILE = STATE_DIR / "runs.sqlite3"
+
+# 저장할 최대 에러 요약 수
+MAX_STORED_ERRORS = 20
+
+# 가장 최근 실행 결과 상태 이름 (주차 없는 /share status 조회용)
+LATEST_RUN_STATE = "latest_run"
+
+
+class SqliteRunStore:
+    """SQLite 기반 실행 결과 저장소."""
+
+    def __init__(self, path: Path = RUN_DB_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=1)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " week INTEGER NOT NULL,"
+            " finished_at TEXT NOT NULL,"
+            " record TEXT NOT NULL,"
+            " PRIMARY KEY (week, finished_at))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            " name TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL)"
+        )
+        return conn
+
+    def save(self, record: dict) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs (week, finished_at, record) VALUES (?, ?, ?)",
+                (record["week"], record["finished_at"], json.dumps(record, ensure_ascii=False))
+            )
+
+    def latest(self, week: int | None = None) -> dict | None:
+        with self._lock, self._connect() as conn:
+            if week is None:
+                row = conn.execute(
+                    "SELECT record FROM runs ORDER BY finished_at DESC LIMIT 1"
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT record FROM runs WHERE week = ? ORDER BY finished_at DESC LIMIT 1",
+                    (week,)
+                ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def load_state(self, name: str) -> dict | None:
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT value FROM state WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_state(self, name: str, value: dict) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO state (name, value) VALUES (?, ?)",
+                (name, json.dumps(value, ensure_ascii=False))
+            )
+
+
+class DynamoRunStore:
+    """DynamoDB 기반 실행 결과 저장소 (Lambda 간 공유)."""
+
+    def __init__(self, table_name: str, state_table_name: str):
+        import boto3
+
+        dynamodb = boto3.resource("dynamodb")
+        self.table = dynamodb.Table(table_name)
+        self.state_table = dynamodb.Table(state_table_name)
+
+    def save(self, record: dict) -> None:
+        self.table.put_item(Item={
+            "week": record["week"],
+            "finished_at": record["finished_at"],
+            "record": json.dumps(record, ensure_ascii=False)
+        })
+        # 주차 없는 조회는 테이블 스캔 대신 GetItem 1번으로 응답
+        self.save_state(LATEST_RUN_STATE, record)
+
+    def latest(self, week: int | None = None) -> dict | None:
+        if week is None:
+            return self.load_state(LATEST_RUN_STATE)
+
+        from boto3.dynamodb.conditions import Key
+
+        items = self.table.query(
+            KeyConditionExpression=Key("week").eq(week),
+            ScanIndexForward=False,
+            Limit=1
+        ).get("Items", [])
+        return json.loads(items[0]["record"]) if items else None
+
+    def load_state(self, name: str) -> dict | None:
+        item = self.state_table.get_item(Key={"name": name}, ConsistentRead=True).get("Item")
+        return json.loads(item["value"]) if item else None
+
+    def save_state(self, name: str, value: dict) -> None:
+        self.state_table.put_item(Item={
+            "name": name,
+            "value": json.dumps(value, ensure_ascii=False)
+        })
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_run_store():
+    """RUN_STORE 환경변수에 따른 저장소 (배포 환경은 dynamodb, 로컬 기본값 sqlite)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            if os.environ.get("RUN_STORE", "sqlite").lower() == "dynamodb":
+                _store = DynamoRunStore(os.environ["RUN_TABLE_NAME"], os.environ["STATE_TABLE_NAME"])
+            else:
+                _store = SqliteRunStore()
+        return _store
+
+
+def build_run_record(
+    week: int,
+    status: str,
+    share_result: dict | None,
+    duration: float,
+    finished_at: str,
+    user_name: str | None = None,
+    message: str | None = None
+) -> dict:
+    """저장할 실행 결과 생성 (에러 요약은 최대 MAX_STORED_ERRORS개)."""
+    share_result = share_result or {}
+    shared_folders = share_result.get("shared_folders", [])
+    errors = share_result.get("errors", [])
+    pending = share_result.get("pending", [])
+    return {
+        "week": week,
+        "status": status,
+        "finished_at": finished_at,
+        "duration_s": round(duration, 1),
+        "user_name": user_name,
+        "message": message,
+        "shared_folders": [
+            {"batch": f["batch"], "week": f["week"], "link": f["link"]}
+            for f in shared_folders
+        ],
+        "shared_count": len(shared_folders),
+        "error_count": share_result.get("error_count", len(errors)),
+        # 미처리 작업은 기수별 건수 (재실행 시 이미 공유된 사용자는 건너뜀)
+        "pending": [
+            {"batch": p["batch"], "week": p["week"], "count": p["count"]}
+            for p in pending
+        ],
+        "pending_count": sum(p["count"] for p in pending),
+        "errors": errors[:MAX_STORED_ERRORS]
+    }
+
+
+def format_run_status(record: dict | None, week: int | None = None) -> str:
+    """/share status 응답 문구."""
+    if record is None:
+        target = f"{week}주차" if week is not None else "최근"
+        return f"📭 {target} 공유 실행 기록이 없습니다."
+
+    icon = {"success": "✅", "error": "❌"}.get(record["status"], "ℹ️")
+    lines = [
+        f"{icon} {record['week']}주차 공유 {record['status']} ({record['finished_at']}, {record['duration_s']}초)",
+        f"• 공유 기수 {record['shared_count']}개, 오류 {record['error_count']}건"
+    ]
+    if record.get("pending_count"):
+        batches = ", ".join(f"{p['batch']} {p['count']}명" for p in record.get("pending", []))
+        lines.append(
+            f"• 미처리 {record['pending_count']}건 ({batches}) "
+            f"- `/share {record['week']}` 재실행 시 이어서 처리"
+        )
+    if record.get("message") and record["status"] != "success":
+        lines.append(f"• {record['message'][:200]}")
+    lines.extend(
+        f"📁 {f['batch']} {f['week']}주차 → <{f['link']}|링크>"
+        for f in record["shared_folders"]
+    )
+    return "\n".join(lines)
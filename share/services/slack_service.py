@@ -1,8 +1,39 @@
 """Slack 메시지 발송 서비스."""
 
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
 
+from services.circuit_breaker import SLACK, get_breaker
+
+# Slack API 타임아웃 (초)
+SLACK_TIMEOUT = 10
+
+# 기수별 채널 설정 파일
+CHANNELS_FILE = Path(__file__).parent.parent / "data" / "channels.json"
+
+# 채널당 최소 발송 간격 (초) - Slack 채널별 약 1건/초 제한
+CHANNEL_MIN_INTERVAL = 1.0
+
+# 에러 메시지 최대 길이
+MAX_ERROR_LENGTH = 1000
+
+# 동시에 발송할 최대 채널 수
+FANOUT_MAX_WORKERS = 8
+
+
+class SlackRateLimitError(Exception):
+    """Slack API rate limit (HTTP 429) 응답."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"Slack rate limit ({retry_after}초 후 재시도)")
+
 
 def get_slack_config() -> dict:
     """Slack 설정 가져오기."""
@@ -51,12 +82,18 @@ def send_message(message: str | dict, channel: str = None) -> dict:
             "mrkdwn": True
         }
 
-    response = requests.post(
+    # Slack 장애 시 회로 차단으로 즉시 실패
+    response = get_breaker(SLACK).call(
+        requests.post,
         "https://slack.com/api/chat.postMessage",
         headers=headers,
-        json=payload
+        json=payload,
+        timeout=SLACK_TIMEOUT
     )
 
+    if response.status_code == 429:
+        raise SlackRateLimitError(float(response.headers.get("Retry-After", CHANNEL_MIN_INTERVAL)))
+
     result = response.json()
 
     if not result.get("ok"):
@@ -65,6 +102,91 @@ def send_message(message: str | dict, channel: str = None) -> dict:
     return result
 
 
+def load_channels() -> dict[str, str]:
+    """기수별 Slack 채널 ID 로드 (설정 파일이 없으면 빈 dict)."""
+    if not CHANNELS_FILE.exists():
+        return {}
+    with open(CHANNELS_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def fan_out_messages(
+    deliveries: list[dict],
+    min_interval: float = CHANNEL_MIN_INTERVAL,
+    max_retries: int = 3
+) -> list[dict]:
+    """여러 채널에 메시지 동시 발송 (채널별 발송 간격 준수).
+
+    채널이 다르면 동시에 발송하고, 같은 채널 메시지는 min_interval 간격으로 순차 발송합니다.
+
+    Args:
+        deliveries: 발송 목록 [{"channel": 채널 ID, "message": 메시지, "label": 표시 이름}]
+        min_interval: 채널당 최소 발송 간격 (초)
+        max_retries: rate limit 시 최대 재시도 횟수
+
+    Returns:
+        발송 목록 순서대로의 채널별 발송 결과
+    """
+    reports = [None] * len(deliveries)
+
+    # 채널별로 묶어 채널 내부는 순서 유지
+    by_channel: dict[str, list[int]] = {}
+    for i, delivery in enumerate(deliveries):
+        by_channel.setdefault(delivery["channel"], []).append(i)
+
+    lock = threading.Lock()
+
+    def deliver_channel(channel: str, indexes: list[int]) -> None:
+        last_sent = None
+        for i in indexes:
+            delivery = deliveries[i]
+            report = {
+                "channel": channel,
+                "label": delivery.get("label"),
+                "ok": False,
+                "attempts": 0
+            }
+
+            for attempt in range(max_retries):
+                # 채널별 발송 간격 유지
+                if last_sent is not None:
+                    wait = min_interval - (time.monotonic() - last_sent)
+                    if wait > 0:
+                        time.sleep(wait)
+
+                report["attempts"] += 1
+                last_sent = time.monotonic()
+                try:
+                    result = send_message(delivery["message"], channel=channel)
+                    report.update({"ok": True, "ts": result.get("ts")})
+                    report.pop("error", None)
+                    break
+                except SlackRateLimitError as e:
+                    report["error"] = str(e)
+                    # 마지막 시도면 대기하지 않고 종료
+                    if attempt + 1 < max_retries:
+                        time.sleep(e.retry_after)
+                except Exception as e:
+                    report["error"] = str(e)
+                    break
+
+            with lock:
+                reports[i] = report
+
+    if not by_channel:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(FANOUT_MAX_WORKERS, len(by_channel))) as executor:
+        futures = [
+            executor.submit(deliver_channel, channel, indexes)
+            for channel, indexes in by_channel.items()
+        ]
+        for future in futures:
+            future.result()
+
+    return reports
+
+
 def send_to_response_url(response_url: str, message: str) -> dict:
     """Slack response_url로 메시지 발송.
 
@@ -125,10 +247,11 @@ def send_to_response_url(response_url: str, message: str) -> dict:
     }
 
     # 타임아웃 설정 및 리다이렉트 비활성화 (SSRF 방지)
-    response = requests.post(
+    response = get_breaker(SLACK).call(
+        requests.post,
         response_url,
         json=payload,
-        timeout=10,
+        timeout=SLACK_TIMEOUT,
         allow_redirects=False  # 리다이렉트 방지
     )
 
@@ -142,12 +265,15 @@ def send_error_message(error: str, context: dict = None) -> dict:
     """에러 메시지 발송.
 
     Args:
-        error: 에러 메시지
+        error: 에러 메시지 (최대 MAX_ERROR_LENGTH자)
         context: 추가 컨텍스트 정보
 
     Returns:
         Slack API 응답
     """
+    if len(error) > MAX_ERROR_LENGTH:
+        error = error[:MAX_ERROR_LENGTH] + "..."
+
     message = f"⚠️ **오류 발생**\n\n```{error}```"
 
     if context: